@@ -1,6 +1,8 @@
 """GitBackend protocol and implementations (Real, Mock, DryRun)."""
 
 import json
+import os
+import posixpath
 import subprocess
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
@@ -9,6 +11,28 @@ from typing import Protocol, runtime_checkable
 
 DEFAULT_STALE_DAYS = 7
 
+# Fetch, resolve origin's default branch, and merge it in a single shell
+# invocation. The worktree path is passed as $1. Prints the default branch
+# name and exits 0 on merge, 1 on conflict (merge aborted), 2 if fetch failed.
+_FETCH_AND_MERGE_SCRIPT = """\
+git -C "$1" fetch --all >/dev/null 2>&1 || exit 2
+branch=$(git -C "$1" symbolic-ref refs/remotes/origin/HEAD 2>/dev/null)
+branch=${branch#refs/remotes/origin/}
+if [ -z "$branch" ]; then
+  branch=main
+  for candidate in main master; do
+    if git -C "$1" rev-parse --verify -q "refs/remotes/origin/$candidate" >/dev/null; then
+      branch=$candidate
+      break
+    fi
+  done
+fi
+echo "$branch"
+git -C "$1" merge "origin/$branch" --no-edit >/dev/null 2>&1 && exit 0
+git -C "$1" merge --abort >/dev/null 2>&1
+exit 1
+"""
+
 
 def _extract_repo_name(url: str) -> str:
     """Extract repo name from a URL (e.g. 'my-repo' from a GitHub URL)."""
@@ -67,6 +91,29 @@ def _find_local_clone(repo_name: str, search_paths: list[Path]) -> Path | None:
     return None
 
 
+def _refs_fingerprint(repo: Path, branch: str) -> tuple[int, ...] | None:
+    """Return mtimes that change whenever the branch ref is created or deleted.
+
+    Covers packed-refs plus the loose-ref directories holding the local and
+    origin copies of the branch. Returns None if repo has no .git directory.
+    """
+    git_dir = repo / ".git"
+    if not git_dir.is_dir():
+        return None
+    parent = posixpath.dirname(branch)
+    stamps: list[int] = []
+    for path in (
+        git_dir / "packed-refs",
+        git_dir / "refs" / "heads" / parent,
+        git_dir / "refs" / "remotes" / "origin" / parent,
+    ):
+        try:
+            stamps.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            stamps.append(0)
+    return tuple(stamps)
+
+
 def _default_search_paths() -> list[Path]:
     """Compute default search paths lazily so CWD is evaluated at call time."""
     return [Path.cwd(), Path.home()]
@@ -137,6 +184,14 @@ class GitBackend(Protocol):
         """Get the default branch name for the remote (e.g. 'main' or 'master')."""
         ...
 
+    def fetch_and_merge_default(self, repo: Path) -> tuple[str, str]:
+        """Fetch, then merge the remote default branch in one round trip.
+
+        Returns (outcome, default_branch) where outcome is one of:
+        "merged", "conflict" (merge auto-aborted), or "fetch_failed".
+        """
+        ...
+
     def has_merged_pr(self, repo: Path, branch: str) -> bool:
         """Check if the branch has a merged PR (via gh CLI)."""
         ...
@@ -187,6 +242,9 @@ class RealGitBackend:
     ) -> None:
         self._search_paths = search_paths
         self._stream_output = stream_output
+        # Memoized lookups, reused across spawns that share this backend
+        self._local_clones: dict[str, Path] = {}
+        self._branch_cache: dict[tuple[str, str], tuple[tuple[int, ...], bool]] = {}
 
     def clone(self, url: str, path: Path) -> bool:
         result = subprocess.run(
@@ -247,9 +305,15 @@ class RealGitBackend:
             return None
 
         if repo.startswith(("https://", "http://", "git@")):
+            cached = self._local_clones.get(repo)
+            if cached is not None and _is_git_repo(cached):
+                return cached
             repo_name = _extract_repo_name(repo)
             paths = self._search_paths or _default_search_paths()
-            return _find_local_clone(repo_name, paths)
+            found = _find_local_clone(repo_name, paths)
+            if found is not None:
+                self._local_clones[repo] = found
+            return found
 
         path = Path(repo)
         if _is_git_repo(path):
@@ -283,6 +347,18 @@ class RealGitBackend:
         return worktrees
 
     def branch_exists(self, repo: Path, branch: str) -> bool:
+        # Reuse the last answer while the refs backing this branch are unchanged
+        key = (str(repo), branch)
+        fingerprint = _refs_fingerprint(repo, branch)
+        cached = self._branch_cache.get(key)
+        if fingerprint is not None and cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        exists = self._branch_exists_uncached(repo, branch)
+        if fingerprint is not None:
+            self._branch_cache[key] = (fingerprint, exists)
+        return exists
+
+    def _branch_exists_uncached(self, repo: Path, branch: str) -> bool:
         # Check local branches
         result = subprocess.run(
             ["git", "-C", str(repo), "rev-parse", "--verify", f"refs/heads/{branch}"],
@@ -395,6 +471,19 @@ class RealGitBackend:
                 return candidate
         return "main"
 
+    def fetch_and_merge_default(self, repo: Path) -> tuple[str, str]:
+        result = subprocess.run(
+            ["sh", "-c", _FETCH_AND_MERGE_SCRIPT, "sh", str(repo)],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode == 2:
+            return ("fetch_failed", "")
+        default_branch = result.stdout.strip() or "main"
+        if result.returncode == 0:
+            return ("merged", default_branch)
+        return ("conflict", default_branch)
+
     def has_merged_pr(self, repo: Path, branch: str) -> bool:
         result = subprocess.run(
             [
@@ -722,6 +811,15 @@ class MockGitBackend:
     def get_default_branch(self, repo: Path) -> str:  # noqa: ARG002
         return self.default_branch
 
+    def fetch_and_merge_default(self, repo: Path) -> tuple[str, str]:
+        if self.fail_on == "fetch":
+            return ("fetch_failed", "")
+        self.fetched.append(repo)
+        if self.fail_on == "merge_branch":
+            return ("conflict", self.default_branch)
+        self.merges.append((repo, f"origin/{self.default_branch}"))
+        return ("merged", self.default_branch)
+
     def has_merged_pr(self, repo: Path, branch: str) -> bool:  # noqa: ARG002
         return branch in self.merged_branches
 
@@ -814,6 +912,13 @@ class DryRunGitBackend:
         self.commands.append(f"git -C {repo} symbolic-ref refs/remotes/origin/HEAD")
         return "main"
 
+    def fetch_and_merge_default(self, repo: Path) -> tuple[str, str]:
+        self.commands.append(
+            f"git -C {repo} fetch --all && "
+            f"git -C {repo} merge origin/<default-branch> --no-edit"
+        )
+        return ("merged", "main")
+
     def has_merged_pr(self, repo: Path, branch: str) -> bool:  # noqa: ARG002
         self.commands.append(f"gh pr list --head {branch} --state merged --json number")
         return False
@@ -11,7 +11,6 @@ import os
 import re
 import subprocess
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
@@ -30,7 +29,11 @@ from superintendent.orchestrator.step_handler import (
     RealStepHandler,
 )
 from superintendent.orchestrator.strategy import ExecutionStrategy, TaskInfo
-from superintendent.state.registry import WorktreeEntry, WorktreeRegistry
+from superintendent.state.registry import (
+    WorktreeEntry,
+    WorktreeRegistry,
+    existing_worktree_paths,
+)
 from superintendent.state.token_store import (
     DEFAULT_KEY,
     TokenStore,
@@ -159,16 +162,14 @@ def get_default_registry() -> WorktreeRegistry:
     return WorktreeRegistry(Path.home() / ".claude" / "superintendent-registry.json")
 
 
-def list_entries(registry: WorktreeRegistry) -> list[WorktreeEntry]:
-    """List all entries from the registry."""
-    return registry.list_all()
+_SLUG_INVALID = re.compile(r"[^a-zA-Z0-9_\-.]")
+_SLUG_COLLAPSE = re.compile(r"-+")
 
 
 def _branch_to_slug(branch: str) -> str:
     """Convert a branch name to a filesystem-safe slug."""
-    slug = branch.replace("/", "-")
-    slug = re.sub(r"[^a-zA-Z0-9_\-.]", "-", slug)
-    slug = re.sub(r"-+", "-", slug)
+    slug = _SLUG_INVALID.sub("-", branch.replace("/", "-"))
+    slug = _SLUG_COLLAPSE.sub("-", slug)
     return slug.strip("-")
 
 
@@ -206,13 +207,12 @@ def cleanup_all(
     Returns list of removed entry names.
     """
     entries = registry.list_all()
-    stale: list[str] = []
-    for entry in entries:
-        if not Path(entry.worktree_path).exists():
-            stale.append(entry.name)
+    existing_paths = existing_worktree_paths(e.worktree_path for e in entries)
+    stale = [e.name for e in entries if e.worktree_path not in existing_paths]
 
     if stale and not dry_run:
-        registry.cleanup()
+        # Drop exactly what was reported, without re-checking every path
+        registry.remove_many(stale)
 
     return stale
 
@@ -231,16 +231,24 @@ def analyze_entry(
     entry: WorktreeEntry,
     git: GitBackend,
     stale_days: int = 30,
+    existing_paths: set[str] | None = None,
 ) -> CleanupCandidate | None:
     """Analyze an entry for cleanup eligibility.
 
+    If existing_paths is given (from existing_worktree_paths), it is used
+    instead of checking the filesystem for the worktree path.
+
     Returns a CleanupCandidate if the entry qualifies, else None.
     """
     candidate = CleanupCandidate(entry=entry)
     worktree_path = Path(entry.worktree_path)
+    if existing_paths is None:
+        path_exists = worktree_path.exists()
+    else:
+        path_exists = entry.worktree_path in existing_paths
 
     # Check cleanup qualifications
-    if not worktree_path.exists():
+    if not path_exists:
         candidate.reasons.append("path does not exist")
     else:
         repo_path = worktree_path
@@ -258,7 +266,7 @@ def analyze_entry(
         return None
 
     # Safety checks (only if the path exists)
-    if worktree_path.exists():
+    if path_exists:
         if git.has_uncommitted_changes(worktree_path):
             candidate.warnings.append("has uncommitted changes")
             candidate.force_required = True
@@ -282,10 +290,13 @@ def smart_cleanup(
     and only removes force_required entries if force is True.
     """
     entries = registry.list_all()
+    existing_paths = existing_worktree_paths(e.worktree_path for e in entries)
     candidates: list[CleanupCandidate] = []
 
     for entry in entries:
-        candidate = analyze_entry(entry, git, stale_days=stale_days)
+        candidate = analyze_entry(
+            entry, git, stale_days=stale_days, existing_paths=existing_paths
+        )
         if candidate is not None:
             candidates.append(candidate)
 
@@ -520,18 +531,16 @@ def run(
 def list_cmd() -> None:
     """List all active entries."""
     registry = get_default_registry()
-    entries = list_entries(registry)
-    if not entries:
+    found = False
+    for entry in registry.iter_entries():
+        found = True
+        sandbox_info = f" (sandbox: {entry.sandbox_name})" if entry.sandbox_name else ""
+        typer.echo(
+            f"  {entry.name}: {entry.repo} [{entry.branch}]"
+            f" {entry.worktree_path}{sandbox_info}"
+        )
+    if not found:
         typer.echo("No entries found.")
-    else:
-        for entry in entries:
-            sandbox_info = (
-                f" (sandbox: {entry.sandbox_name})" if entry.sandbox_name else ""
-            )
-            typer.echo(
-                f"  {entry.name}: {entry.repo} [{entry.branch}]"
-                f" {entry.worktree_path}{sandbox_info}"
-            )
 
 
 @app.command()
@@ -1046,6 +1055,9 @@ def status(
     if not needs_fetch:
         return
 
+    # Only the status path needs a thread pool; keep it out of CLI startup
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
     # Fetch git info in parallel, stream results as they resolve
     def _resolve_entry(
         entry: WorktreeEntry,
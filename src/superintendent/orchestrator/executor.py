@@ -1,9 +1,10 @@
 """Executor: runs a WorkflowPlan step by step, managing state transitions."""
 
+import time
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, NamedTuple, Protocol, runtime_checkable
 
 from superintendent.orchestrator.models import WorkflowPlan, WorkflowStep
 from superintendent.state.workflow import (
@@ -43,6 +44,34 @@ class ExecutionResult:
     step_results: dict[str, StepResult] = field(default_factory=dict)
 
 
+class _Checkpoint(NamedTuple):
+    """Compact per-step checkpoint; expanded to a dict only when read.
+
+    ``completed`` is an append-only list private to the executor run and
+    ``completed_count`` its length at save time, so no copy is made per step.
+    It is never the list handed back in ExecutionResult, so callers that
+    edit their result cannot rewrite checkpoint history.
+    """
+
+    step_id: str
+    state_name: str
+    success: bool
+    completed: list[str]
+    completed_count: int
+    timestamp_ns: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "step_id": self.step_id,
+            "state": self.state_name,
+            "success": self.success,
+            "completed_steps": self.completed[: self.completed_count],
+            "timestamp": datetime.fromtimestamp(
+                self.timestamp_ns / 1e9, UTC
+            ).isoformat(),
+        }
+
+
 # Map from step action to the workflow state entered when running that action.
 _ACTION_TO_STATE: dict[str, WorkflowState] = {
     "validate_repo": WorkflowState.ENSURING_REPO,
@@ -56,6 +85,11 @@ _ACTION_TO_STATE: dict[str, WorkflowState] = {
     "start_agent": WorkflowState.STARTING_AGENT,
 }
 
+# Position of each state in WORKFLOW_ORDER, for O(1) forward-walk lookups.
+_STATE_INDEX: dict[WorkflowState, int] = {
+    state: i for i, state in enumerate(WORKFLOW_ORDER)
+}
+
 
 class Executor:
     """Runs a WorkflowPlan through backends, managing state and checkpoints."""
@@ -68,7 +102,7 @@ class Executor:
         self._handler = handler
         self._on_step_start = on_step_start
         self._state = WorkflowState.INIT
-        self._checkpoints: list[dict[str, Any]] = []
+        self._checkpoints: list[_Checkpoint] = []
 
     @property
     def state(self) -> WorkflowState:
@@ -76,7 +110,7 @@ class Executor:
 
     @property
     def checkpoints(self) -> list[dict[str, Any]]:
-        return list(self._checkpoints)
+        return [cp.to_dict() for cp in self._checkpoints]
 
     def _transition(self, target: WorkflowState) -> None:
         """Transition to target state, advancing through intermediates if needed.
@@ -90,10 +124,8 @@ class Executor:
             return
 
         # Try to advance through intermediate states to reach target
-        current_idx = (
-            WORKFLOW_ORDER.index(self._state) if self._state in WORKFLOW_ORDER else -1
-        )
-        target_idx = WORKFLOW_ORDER.index(target) if target in WORKFLOW_ORDER else -1
+        current_idx = _STATE_INDEX.get(self._state, -1)
+        target_idx = _STATE_INDEX.get(target, -1)
 
         if current_idx >= 0 and target_idx > current_idx:
             # Walk forward through intermediate states
@@ -112,13 +144,14 @@ class Executor:
         completed: list[str],
     ) -> None:
         self._checkpoints.append(
-            {
-                "step_id": step.id,
-                "state": self._state.name,
-                "success": result.success,
-                "completed_steps": list(completed),
-                "timestamp": datetime.now(UTC).isoformat(),
-            }
+            _Checkpoint(
+                step.id,
+                self._state.name,
+                result.success,
+                completed,
+                len(completed),
+                time.time_ns(),
+            )
         )
 
     def run(self, plan: WorkflowPlan) -> ExecutionResult:
@@ -138,19 +171,29 @@ class Executor:
 
         ordered_steps = plan.execution_order()
         result = ExecutionResult(state=WorkflowState.INIT)
+        # Bind per-step lookups once; the loop body runs for every step
+        state_for_action = _ACTION_TO_STATE.get
+        execute = self._handler.execute
+        transition = self._transition
+        save_checkpoint = self._save_checkpoint
+        on_step_start = self._on_step_start
+        completed_steps = result.completed_steps
+        # Checkpoints slice this list lazily; only the executor appends to it
+        checkpoint_log: list[str] = []
+        step_results = result.step_results
 
         for step in ordered_steps:
             # Transition to the appropriate state for this action
-            target_state = _ACTION_TO_STATE.get(step.action)
+            target_state = state_for_action(step.action)
             if target_state is None:
                 result.state = WorkflowState.FAILED
                 result.failed_step = step.id
                 result.error = f"Unknown action: {step.action}"
-                self._transition(WorkflowState.FAILED)
+                transition(WorkflowState.FAILED)
                 return result
 
             try:
-                self._transition(target_state)
+                transition(target_state)
             except InvalidTransitionError as e:
                 result.state = WorkflowState.FAILED
                 result.failed_step = step.id
@@ -159,18 +202,19 @@ class Executor:
                 return result
 
             # Notify listener before execution
-            if self._on_step_start is not None:
-                self._on_step_start(step)
+            if on_step_start is not None:
+                on_step_start(step)
 
             # Execute the step
-            step_result = self._handler.execute(step)
-            result.step_results[step.id] = step_result
-            self._save_checkpoint(step, step_result, result.completed_steps)
+            step_result = execute(step)
+            step_results[step.id] = step_result
+            save_checkpoint(step, step_result, checkpoint_log)
 
             if step_result.success:
-                result.completed_steps.append(step.id)
+                completed_steps.append(step.id)
+                checkpoint_log.append(step.id)
             else:
-                self._transition(WorkflowState.FAILED)
+                transition(WorkflowState.FAILED)
                 result.state = WorkflowState.FAILED
                 result.failed_step = step.id
                 result.error = step_result.message
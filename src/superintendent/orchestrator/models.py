@@ -1,5 +1,7 @@
 """WorkflowStep and WorkflowPlan models for the orchestrator."""
 
+import functools
+import heapq
 import json
 from dataclasses import dataclass, field
 from enum import StrEnum
@@ -29,7 +31,7 @@ class Verbosity(StrEnum):
     verbose = "verbose"
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowStep:
     """A single step in a workflow plan."""
 
@@ -80,7 +82,17 @@ class WorkflowPlan:
         self._step_by_id[step.id] = step
 
     def validate(self) -> list[str]:
-        """Return a list of validation errors (empty if valid)."""
+        """Return a list of validation errors (empty if valid).
+
+        Results are cached by graph shape (step IDs and dependencies), so
+        plans built from the same template are only checked once.
+        """
+        return list(_graph_errors(self._skeleton()))
+
+    def _skeleton(self) -> tuple[tuple[str, tuple[str, ...]], ...]:
+        return tuple((step.id, tuple(step.depends_on)) for step in self.steps)
+
+    def _check_graph(self) -> list[str]:
         errors: list[str] = []
 
         # Check for duplicate IDs
@@ -142,39 +154,21 @@ class WorkflowPlan:
         return None
 
     def execution_order(self) -> list[WorkflowStep]:
-        """Return steps in topological order (dependencies first)."""
-        errors = self.validate()
+        """Return steps in topological order (dependencies first).
+
+        Like validate(), the order is cached by graph shape.
+        """
+        skeleton = self._skeleton()
+        errors = _graph_errors(skeleton)
         if errors:
             raise ValueError(f"Invalid plan: {'; '.join(errors)}")
+        return [self._step_by_id[step_id] for step_id in _topological_ids(skeleton)]
 
-        in_degree: dict[str, int] = {step.id: 0 for step in self.steps}
-        dependents: dict[str, list[str]] = {step.id: [] for step in self.steps}
-
-        for step in self.steps:
-            for dep in step.depends_on:
-                in_degree[step.id] += 1
-                dependents[dep].append(step.id)
-
-        # Kahn's algorithm
-        queue = [sid for sid, deg in in_degree.items() if deg == 0]
-        # Sort for deterministic ordering among steps with equal priority
-        queue.sort()
-        result: list[WorkflowStep] = []
-
-        while queue:
-            current = queue.pop(0)
-            result.append(self._step_by_id[current])
-            neighbors = sorted(dependents[current])
-            for neighbor in neighbors:
-                in_degree[neighbor] -= 1
-                if in_degree[neighbor] == 0:
-                    queue.append(neighbor)
-                    queue.sort()
-
-        return result
-
-    def to_json(self) -> str:
-        return json.dumps(self.to_dict(), indent=2)
+    def to_json(self, indent: int | None = 2) -> str:
+        """Serialize the plan; ``indent=None`` gives compact single-line JSON."""
+        if indent is None:
+            return json.dumps(self.to_dict(), separators=(",", ":"))
+        return json.dumps(self.to_dict(), indent=indent)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -192,3 +186,43 @@ class WorkflowPlan:
         steps = [WorkflowStep.from_dict(s) for s in data.get("steps", [])]
         metadata = data.get("metadata", {})
         return cls(steps=steps, metadata=metadata)
+
+
+@functools.lru_cache(maxsize=32)
+def _graph_errors(skeleton: tuple[tuple[str, tuple[str, ...]], ...]) -> tuple[str, ...]:
+    """Validate a step graph given as (id, depends_on) pairs."""
+    plan = WorkflowPlan(
+        steps=[
+            WorkflowStep(id=step_id, action="", depends_on=list(deps))
+            for step_id, deps in skeleton
+        ]
+    )
+    return tuple(plan._check_graph())
+
+
+@functools.lru_cache(maxsize=32)
+def _topological_ids(
+    skeleton: tuple[tuple[str, tuple[str, ...]], ...],
+) -> tuple[str, ...]:
+    """Kahn's algorithm over a valid step graph; ties resolve by smallest ID."""
+    in_degree: dict[str, int] = {step_id: 0 for step_id, _ in skeleton}
+    dependents: dict[str, list[str]] = {step_id: [] for step_id, _ in skeleton}
+
+    for step_id, deps in skeleton:
+        for dep in deps:
+            in_degree[step_id] += 1
+            dependents[dep].append(step_id)
+
+    ready = [step_id for step_id, degree in in_degree.items() if degree == 0]
+    heapq.heapify(ready)
+    order: list[str] = []
+
+    while ready:
+        current = heapq.heappop(ready)
+        order.append(current)
+        for neighbor in dependents[current]:
+            in_degree[neighbor] -= 1
+            if in_degree[neighbor] == 0:
+                heapq.heappush(ready, neighbor)
+
+    return tuple(order)
@@ -6,6 +6,9 @@ pipeline, managing parallelism, monitoring, and failure handling.
 """
 
 import asyncio
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import StrEnum
@@ -47,8 +50,13 @@ class AgentHandle:
     task_group: list[TaskInfo]
     sandbox_name: str | None = None
     started_at: datetime | None = None
+    started_monotonic: float | None = None
     execution_result: ExecutionResult | None = None
     retry_count: int = 0
+    task_names: list[str] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.task_names = [t.name for t in self.task_group]
 
 
 @dataclass
@@ -70,6 +78,47 @@ class _PendingGroup:
 
     tasks: list[TaskInfo]
     retry_count: int = 0
+    task_names: list[str] = field(init=False)
+    description: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.task_names = [t.name for t in self.tasks]
+        self.description = "; ".join(self.task_names)
+
+
+class _PendingQueue:
+    """Internal: FIFO of pending groups that keeps a running task count.
+
+    Wraps a private deque and exposes only the operations that keep
+    task_count in step with the queued groups.
+    """
+
+    __slots__ = ("_groups", "task_count")
+
+    def __init__(self, groups: Iterable[_PendingGroup] = ()) -> None:
+        self._groups: deque[_PendingGroup] = deque()
+        self.task_count = 0
+        for pg in groups:
+            self.append(pg)
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def __iter__(self) -> Iterator[_PendingGroup]:
+        return iter(self._groups)
+
+    def append(self, pg: _PendingGroup) -> None:
+        self._groups.append(pg)
+        self.task_count += len(pg.tasks)
+
+    def popleft(self) -> _PendingGroup:
+        pg = self._groups.popleft()
+        self.task_count -= len(pg.tasks)
+        return pg
+
+    def clear(self) -> None:
+        self._groups.clear()
+        self.task_count = 0
 
 
 # Shell command to check if an agent process has completed.
@@ -106,6 +155,10 @@ class Orchestrator:
         self._max_retries = max_retries
         self._token_store = token_store or TokenStore()
         self._planner = Planner()
+        self._context = ExecutionContext(
+            backends=backends, token_store=self._token_store
+        )
+        self._handler = RealStepHandler(self._context)
         self._agent_counter = 0
 
     def _next_agent_id(self) -> str:
@@ -117,12 +170,15 @@ class Orchestrator:
         """Run the full orchestration loop.
 
         Spawns agents for task groups (up to max_parallel concurrently),
-        monitors their status, handles completions/failures, checks for
-        newly-unblocked tasks, and returns a summary result.
+        waits for the next agent to finish, handles completions/failures,
+        checks for newly-unblocked tasks, and returns a summary result.
         """
-        start_time = datetime.now(UTC)
-        pending = [_PendingGroup(tasks=list(g)) for g in decision.task_groups]
+        start_time = time.monotonic()
+        pending = _PendingQueue(
+            _PendingGroup(tasks=list(g)) for g in decision.task_groups
+        )
         running: dict[str, AgentHandle] = {}
+        watchers: dict[str, asyncio.Task[AgentStatus]] = {}
         result = OrchestratorResult()
         completed_task_names: set[str] = set()
         all_task_names: set[str] = {
@@ -130,70 +186,93 @@ class Orchestrator:
         }
         aborted = False
 
-        while (pending or running) and not aborted:
-            # Spawn agents up to parallelism limit
-            while pending and len(running) < self._max_parallel and not aborted:
-                pg = pending.pop(0)
-                handle = self._spawn_agent(pg, decision, repo)
-                if handle:
-                    running[handle.id] = handle
-                    result.agents_spawned += 1
-                    task_names = [t.name for t in pg.tasks]
-                    self._reporter.on_agent_started(
-                        handle.id,
-                        task_names,
-                        sandbox_name=handle.sandbox_name,
-                    )
-                else:
-                    for task in pg.tasks:
-                        result.failed_tasks.append(task.name)
-                    result.errors.append(
-                        f"Failed to spawn agent for: "
-                        f"{', '.join(t.name for t in pg.tasks)}"
+        try:
+            while (pending or running) and not aborted:
+                # Spawn agents up to parallelism limit
+                while pending and len(running) < self._max_parallel and not aborted:
+                    pg = pending.popleft()
+                    handle = self._spawn_agent(pg, decision, repo)
+                    if handle:
+                        running[handle.id] = handle
+                        watchers[handle.id] = asyncio.create_task(
+                            self._watch_agent(handle, decision.target)
+                        )
+                        result.agents_spawned += 1
+                        self._reporter.on_agent_started(
+                            handle.id,
+                            handle.task_names,
+                            sandbox_name=handle.sandbox_name,
+                        )
+                    else:
+                        result.failed_tasks.extend(pg.task_names)
+                        result.errors.append(
+                            f"Failed to spawn agent for: {', '.join(pg.task_names)}"
+                        )
+
+                if not running:
+                    break
+
+                # Sleep until at least one agent finishes
+                done, _ = await asyncio.wait(
+                    watchers.values(), return_when=asyncio.FIRST_COMPLETED
+                )
+                done_agents = [
+                    (agent_id, task.result())
+                    for agent_id, task in watchers.items()
+                    if task in done
+                ]
+
+                # Process completed/failed agents
+                any_completed = False
+                status_updates: list[tuple[str, TaskStatus]] = []
+                for agent_id, status in done_agents:
+                    del watchers[agent_id]
+                    handle = running.pop(agent_id)
+                    task_names = handle.task_names
+                    duration = 0.0
+                    if handle.started_monotonic is not None:
+                        duration = time.monotonic() - handle.started_monotonic
+
+                    if status == AgentStatus.COMPLETED:
+                        self._handle_success(
+                            handle, result, completed_task_names, status_updates
+                        )
+                        self._reporter.on_agent_completed(
+                            agent_id, task_names, duration
+                        )
+                        any_completed = True
+                    else:
+                        error_msg = f"Agent {agent_id} failed"
+                        self._reporter.on_agent_failed(agent_id, task_names, error_msg)
+                        aborted = self._handle_failure(
+                            handle, result, pending, status_updates
+                        )
+
+                # Write the batch's status updates and check for newly-unblocked
+                # tasks in a worker thread, so the other agents' watchers keep
+                # running while the task source does its I/O
+                if self._task_source and (status_updates or any_completed):
+                    new_groups = await asyncio.to_thread(
+                        self._sync_task_source,
+                        status_updates,
+                        all_task_names if any_completed else None,
                     )
-
-            if not running:
-                break
-
-            # Check status of all running agents
-            done_agents: list[tuple[str, AgentStatus]] = []
-            for agent_id, handle in running.items():
-                status = self._check_agent_status(handle, decision.target)
-                if status != AgentStatus.RUNNING:
-                    done_agents.append((agent_id, status))
-
-            # Process completed/failed agents
-            for agent_id, status in done_agents:
-                handle = running.pop(agent_id)
-                task_names = [t.name for t in handle.task_group]
-                duration = 0.0
-                if handle.started_at:
-                    duration = (datetime.now(UTC) - handle.started_at).total_seconds()
-
-                if status == AgentStatus.COMPLETED:
-                    self._handle_success(handle, result, completed_task_names)
-                    self._reporter.on_agent_completed(agent_id, task_names, duration)
-                    # Check for newly-unblocked tasks from task source
-                    new_groups = self._find_newly_unblocked(all_task_names)
                     for ng in new_groups:
                         pending.append(_PendingGroup(tasks=ng))
                         for t in ng:
                             all_task_names.add(t.name)
-                else:
-                    error_msg = f"Agent {agent_id} failed"
-                    self._reporter.on_agent_failed(agent_id, task_names, error_msg)
-                    aborted = self._handle_failure(handle, result, pending)
-
-            # Report progress
-            self._reporter.on_progress(
-                running=len(running),
-                completed=len(result.completed_tasks),
-                pending=sum(len(pg.tasks) for pg in pending),
-                failed=len(result.failed_tasks),
-            )
 
-            if running:
-                await asyncio.sleep(self._poll_interval)
+                # Report progress
+                self._reporter.on_progress(
+                    running=len(running),
+                    completed=len(result.completed_tasks),
+                    pending=pending.task_count,
+                    failed=len(result.failed_tasks),
+                )
+        finally:
+            for task in watchers.values():
+                task.cancel()
+            await asyncio.gather(*watchers.values(), return_exceptions=True)
 
         # Mark remaining pending tasks as skipped on abort
         if aborted:
@@ -202,14 +281,11 @@ class Orchestrator:
                     result.skipped_tasks.append(task.name)
             pending.clear()
 
-        elapsed = (datetime.now(UTC) - start_time).total_seconds()
-        result.total_time_seconds = elapsed
+        result.total_time_seconds = time.monotonic() - start_time
 
         # Any tasks not accounted for are skipped
-        accounted = (
-            set(result.completed_tasks)
-            | set(result.failed_tasks)
-            | set(result.skipped_tasks)
+        accounted = completed_task_names.union(
+            result.failed_tasks, result.skipped_tasks
         )
         for name in all_task_names:
             if name not in accounted:
@@ -237,12 +313,11 @@ class Orchestrator:
         Returns an AgentHandle if the agent started successfully, None on failure.
         """
         agent_id = self._next_agent_id()
-        task_description = "; ".join(t.name for t in pg.tasks)
         sandbox_name = f"ralph-{agent_id}"
 
         plan_input = PlannerInput(
             repo=repo,
-            task=task_description,
+            task=pg.description,
             mode=decision.mode.value,
             target=decision.target.value,
             sandbox_name=sandbox_name,
@@ -253,9 +328,9 @@ class Orchestrator:
         except ValueError:
             return None
 
-        ctx = ExecutionContext(backends=self._backends, token_store=self._token_store)
-        handler = RealStepHandler(ctx)
-        executor = Executor(handler=handler)
+        # Reuse the shared handler; only step outputs are per-plan state.
+        self._context.step_outputs.clear()
+        executor = Executor(handler=self._handler)
         exec_result = executor.run(plan)
 
         if exec_result.state == WorkflowState.FAILED:
@@ -266,10 +341,23 @@ class Orchestrator:
             task_group=pg.tasks,
             sandbox_name=(sandbox_name if decision.target != Target.local else None),
             started_at=datetime.now(UTC),
+            started_monotonic=time.monotonic(),
             execution_result=exec_result,
             retry_count=pg.retry_count,
         )
 
+    async def _watch_agent(self, handle: AgentHandle, target: Target) -> AgentStatus:
+        """Wait in the background for an agent to finish and return its status.
+
+        Each agent gets its own watcher task, so the main loop only wakes
+        when an agent actually finishes instead of on every poll tick.
+        """
+        while True:
+            status = await asyncio.to_thread(self._check_agent_status, handle, target)
+            if status != AgentStatus.RUNNING:
+                return status
+            await asyncio.sleep(self._poll_interval)
+
     def _check_agent_status(self, handle: AgentHandle, target: Target) -> AgentStatus:
         """Poll the agent's environment to check if it has finished."""
         if target == Target.local or not handle.sandbox_name:
@@ -294,23 +382,23 @@ class Orchestrator:
         handle: AgentHandle,
         result: OrchestratorResult,
         completed_task_names: set[str],
+        status_updates: list[tuple[str, TaskStatus]],
     ) -> None:
-        """Record successful agent completion and update task source."""
-        for task in handle.task_group:
-            result.completed_tasks.append(task.name)
-            completed_task_names.add(task.name)
-            if self._task_source:
-                self._task_source.update_status(task.name, TaskStatus.completed)
+        """Record successful agent completion and queue task source updates."""
+        result.completed_tasks.extend(handle.task_names)
+        completed_task_names.update(handle.task_names)
+        status_updates.extend(
+            (name, TaskStatus.completed) for name in handle.task_names
+        )
 
     def _handle_failure(
         self,
         handle: AgentHandle,
         result: OrchestratorResult,
-        pending: list["_PendingGroup"],
+        pending: _PendingQueue,
+        status_updates: list[tuple[str, TaskStatus]],
     ) -> bool:
         """Handle a failed agent. Returns True if orchestration should abort."""
-        task_names = [t.name for t in handle.task_group]
-
         # Retry if policy allows and retries remaining
         if (
             self._failure_policy == FailurePolicy.RETRY
@@ -325,16 +413,32 @@ class Orchestrator:
             return False
 
         # Record as failed
-        for task in handle.task_group:
-            result.failed_tasks.append(task.name)
-            if self._task_source:
-                self._task_source.update_status(task.name, TaskStatus.failed)
+        result.failed_tasks.extend(handle.task_names)
+        status_updates.extend((name, TaskStatus.failed) for name in handle.task_names)
         result.errors.append(
-            f"Agent {handle.id} failed (tasks: {', '.join(task_names)})"
+            f"Agent {handle.id} failed (tasks: {', '.join(handle.task_names)})"
         )
 
         return self._failure_policy == FailurePolicy.ABORT
 
+    def _sync_task_source(
+        self,
+        status_updates: list[tuple[str, TaskStatus]],
+        known_task_names: set[str] | None,
+    ) -> list[list[TaskInfo]]:
+        """Write a batch of status updates, then query newly-unblocked tasks.
+
+        Updates go first so dependents of just-completed tasks read as ready.
+        The ready query is skipped when known_task_names is None.
+        """
+        if not self._task_source:
+            return []
+        if status_updates:
+            self._task_source.update_statuses(status_updates)
+        if known_task_names is None:
+            return []
+        return self._find_newly_unblocked(known_task_names)
+
     def _find_newly_unblocked(
         self,
         known_task_names: set[str],
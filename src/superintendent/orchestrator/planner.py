@@ -1,13 +1,14 @@
 """Planner: creates a WorkflowPlan from inputs."""
 
+import functools
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 from superintendent.orchestrator.models import WorkflowPlan, WorkflowStep
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PlannerInput:
     """Inputs for the Planner."""
 
@@ -22,6 +23,139 @@ class PlannerInput:
     no_merge: bool = False
 
 
+# Repo strings starting with one of these are cloned rather than used in place
+_URL_PREFIXES = ("http://", "https://", "git@")
+
+
+class _StepTemplate(NamedTuple):
+    """Shape of one plan step; params name keys filled in per plan."""
+
+    id: str
+    action: str
+    params: tuple[str, ...]
+    depends_on: tuple[str, ...]
+
+
+_VALIDATE_REPO = _StepTemplate("validate_repo", "validate_repo", ("repo", "is_url"), ())
+
+# Local: regular worktree, agent started on the host
+_LOCAL_STEPS = (
+    _VALIDATE_REPO,
+    _StepTemplate(
+        "create_worktree",
+        "create_worktree",
+        ("branch", "repo_name", "force", "no_merge"),
+        ("validate_repo",),
+    ),
+    _StepTemplate(
+        "initialize_state",
+        "initialize_state",
+        ("task", "context_file"),
+        ("create_worktree",),
+    ),
+    _StepTemplate(
+        "start_agent",
+        "start_agent",
+        ("task", "mode", "context_file", "branch"),
+        ("initialize_state",),
+    ),
+)
+
+# Sandbox: auth is validated before the expensive steps, and the worktree is
+# a standalone clone so the sandbox is isolated from the source repo
+_SANDBOX_STEPS = (
+    _VALIDATE_REPO,
+    _StepTemplate("validate_auth", "validate_auth", (), ("validate_repo",)),
+    _StepTemplate(
+        "create_worktree",
+        "create_worktree",
+        ("branch", "repo_name", "standalone"),
+        ("validate_auth",),
+    ),
+    _StepTemplate("prepare_template", "prepare_template", (), ("create_worktree",)),
+    _StepTemplate(
+        "prepare_sandbox",
+        "prepare_sandbox",
+        ("sandbox_name", "force"),
+        ("prepare_template",),
+    ),
+    _StepTemplate(
+        "authenticate", "authenticate", ("sandbox_name",), ("prepare_sandbox",)
+    ),
+    _StepTemplate(
+        "initialize_state",
+        "initialize_state",
+        ("task", "context_file"),
+        ("authenticate",),
+    ),
+    _StepTemplate(
+        "start_agent",
+        "start_agent",
+        ("sandbox_name", "task", "mode", "context_file", "branch"),
+        ("initialize_state",),
+    ),
+)
+
+# Container: same flow as sandbox, against an ephemeral container
+_CONTAINER_STEPS = (
+    _VALIDATE_REPO,
+    _StepTemplate("validate_auth", "validate_auth", (), ("validate_repo",)),
+    _StepTemplate(
+        "create_worktree",
+        "create_worktree",
+        ("branch", "repo_name", "standalone"),
+        ("validate_auth",),
+    ),
+    _StepTemplate("prepare_template", "prepare_template", (), ("create_worktree",)),
+    _StepTemplate(
+        "prepare_container",
+        "prepare_container",
+        ("container_name", "force"),
+        ("prepare_template",),
+    ),
+    _StepTemplate(
+        "authenticate", "authenticate", ("container_name",), ("prepare_container",)
+    ),
+    _StepTemplate(
+        "initialize_state",
+        "initialize_state",
+        ("task", "context_file"),
+        ("authenticate",),
+    ),
+    _StepTemplate(
+        "start_agent",
+        "start_agent",
+        ("container_name", "task", "mode", "context_file", "branch"),
+        ("initialize_state",),
+    ),
+)
+
+_STEP_TEMPLATES: dict[str, tuple[_StepTemplate, ...]] = {
+    "local": _LOCAL_STEPS,
+    "sandbox": _SANDBOX_STEPS,
+    "container": _CONTAINER_STEPS,
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _extract_repo_name(repo: str) -> str:
+    """Extract a short repo name from a path or URL."""
+    # Handle URLs like https://github.com/user/repo.git
+    if repo.startswith(_URL_PREFIXES):
+        name = repo.rstrip("/").rsplit("/", 1)[-1]
+        if name.endswith(".git"):
+            name = name[:-4]
+        return name
+
+    # Handle local paths: take the last component without building a Path,
+    # which is only needed to normalise "." and root-like inputs
+    tail = repo.rstrip("/").rpartition("/")[2]
+    if tail and tail != ".":
+        return tail
+    path = Path(repo)
+    return path.name or path.parent.name
+
+
 class Planner:
     """Creates a WorkflowPlan from inputs.
 
@@ -62,263 +196,30 @@ class Planner:
     def _build_steps(
         self, inputs: PlannerInput, metadata: dict[str, Any]
     ) -> list[WorkflowStep]:
-        steps: list[WorkflowStep] = []
-
-        # Step 1: Validate/ensure the repo is available locally
-        is_url = inputs.repo.startswith(("http://", "https://", "git@"))
-        steps.append(
-            WorkflowStep(
-                id="validate_repo",
-                action="validate_repo",
-                params={
-                    "repo": inputs.repo,
-                    "is_url": is_url,
-                },
-            )
-        )
-
-        if inputs.target == "container":
-            self._build_container_steps(steps, inputs, metadata)
-        elif inputs.target == "sandbox":
-            self._build_sandbox_steps(steps, inputs, metadata)
-        else:
-            self._build_local_steps(steps, inputs, metadata)
-
-        return steps
-
-    def _build_local_steps(
-        self,
-        steps: list[WorkflowStep],
-        inputs: "PlannerInput",
-        metadata: dict[str, Any],
-    ) -> None:
-        # Step 2: Create worktree (regular, not standalone)
-        steps.append(
-            WorkflowStep(
-                id="create_worktree",
-                action="create_worktree",
-                params={
-                    "branch": metadata["branch"],
-                    "repo_name": metadata["repo_name"],
-                    "force": inputs.force,
-                    "no_merge": inputs.no_merge,
-                },
-                depends_on=["validate_repo"],
-            )
-        )
-
-        # Step 3: Initialize state
-        steps.append(
-            WorkflowStep(
-                id="initialize_state",
-                action="initialize_state",
-                params={
-                    "task": inputs.task,
-                    "context_file": inputs.context_file,
-                },
-                depends_on=["create_worktree"],
-            )
-        )
-
-        # Step 4: Start agent locally
-        steps.append(
-            WorkflowStep(
-                id="start_agent",
-                action="start_agent",
-                params={
-                    "task": inputs.task,
-                    "mode": inputs.mode,
-                    "context_file": inputs.context_file,
-                    "branch": metadata["branch"],
-                },
-                depends_on=["initialize_state"],
-            )
-        )
-
-    def _build_sandbox_steps(
-        self,
-        steps: list[WorkflowStep],
-        inputs: "PlannerInput",
-        metadata: dict[str, Any],
-    ) -> None:
-        sandbox_name = metadata["sandbox_name"]
-
-        # Step 2: Validate auth before expensive operations
-        steps.append(
-            WorkflowStep(
-                id="validate_auth",
-                action="validate_auth",
-                params={},
-                depends_on=["validate_repo"],
-            )
-        )
-
-        # Step 3: Create worktree (standalone clone for sandbox isolation)
-        steps.append(
-            WorkflowStep(
-                id="create_worktree",
-                action="create_worktree",
-                params={
-                    "branch": metadata["branch"],
-                    "repo_name": metadata["repo_name"],
-                    "standalone": True,
-                },
-                depends_on=["validate_auth"],
-            )
-        )
-
-        # Step 3: Build custom template image with beads CLI
-        steps.append(
-            WorkflowStep(
-                id="prepare_template",
-                action="prepare_template",
-                params={},
-                depends_on=["create_worktree"],
-            )
-        )
-
-        steps.append(
-            WorkflowStep(
-                id="prepare_sandbox",
-                action="prepare_sandbox",
-                params={
-                    "sandbox_name": sandbox_name,
-                    "force": inputs.force,
-                },
-                depends_on=["prepare_template"],
-            )
-        )
-        steps.append(
-            WorkflowStep(
-                id="authenticate",
-                action="authenticate",
-                params={"sandbox_name": sandbox_name},
-                depends_on=["prepare_sandbox"],
-            )
-        )
-        steps.append(
-            WorkflowStep(
-                id="initialize_state",
-                action="initialize_state",
-                params={
-                    "task": inputs.task,
-                    "context_file": inputs.context_file,
-                },
-                depends_on=["authenticate"],
-            )
-        )
-        steps.append(
-            WorkflowStep(
-                id="start_agent",
-                action="start_agent",
-                params={
-                    "sandbox_name": sandbox_name,
-                    "task": inputs.task,
-                    "mode": inputs.mode,
-                    "context_file": inputs.context_file,
-                    "branch": metadata["branch"],
-                },
-                depends_on=["initialize_state"],
-            )
-        )
-
-    def _build_container_steps(
-        self,
-        steps: list[WorkflowStep],
-        inputs: "PlannerInput",
-        metadata: dict[str, Any],
-    ) -> None:
-        container_name = metadata["container_name"]
-
-        # Step 2: Validate auth before expensive operations
-        steps.append(
-            WorkflowStep(
-                id="validate_auth",
-                action="validate_auth",
-                params={},
-                depends_on=["validate_repo"],
-            )
-        )
-
-        # Step 3: Create worktree (standalone clone for container isolation)
-        steps.append(
-            WorkflowStep(
-                id="create_worktree",
-                action="create_worktree",
-                params={
-                    "branch": metadata["branch"],
-                    "repo_name": metadata["repo_name"],
-                    "standalone": True,
-                },
-                depends_on=["validate_auth"],
-            )
-        )
-
-        # Step 3: Build custom template image with beads CLI
-        steps.append(
-            WorkflowStep(
-                id="prepare_template",
-                action="prepare_template",
-                params={},
-                depends_on=["create_worktree"],
-            )
-        )
-
-        steps.append(
-            WorkflowStep(
-                id="prepare_container",
-                action="prepare_container",
-                params={
-                    "container_name": container_name,
-                    "force": inputs.force,
-                },
-                depends_on=["prepare_template"],
-            )
-        )
-        steps.append(
-            WorkflowStep(
-                id="authenticate",
-                action="authenticate",
-                params={"container_name": container_name},
-                depends_on=["prepare_container"],
-            )
-        )
-        steps.append(
-            WorkflowStep(
-                id="initialize_state",
-                action="initialize_state",
-                params={
-                    "task": inputs.task,
-                    "context_file": inputs.context_file,
-                },
-                depends_on=["authenticate"],
-            )
-        )
-        steps.append(
+        # Every param a template may ask for; each step picks its own keys
+        values: dict[str, Any] = {
+            "repo": inputs.repo,
+            "is_url": inputs.repo.startswith(_URL_PREFIXES),
+            "branch": metadata["branch"],
+            "repo_name": metadata["repo_name"],
+            "standalone": True,
+            "force": inputs.force,
+            "no_merge": inputs.no_merge,
+            "task": inputs.task,
+            "mode": inputs.mode,
+            "context_file": inputs.context_file,
+            "sandbox_name": metadata.get("sandbox_name"),
+            "container_name": metadata.get("container_name"),
+        }
+        templates = _STEP_TEMPLATES.get(inputs.target, _LOCAL_STEPS)
+        return [
             WorkflowStep(
-                id="start_agent",
-                action="start_agent",
-                params={
-                    "container_name": container_name,
-                    "task": inputs.task,
-                    "mode": inputs.mode,
-                    "context_file": inputs.context_file,
-                    "branch": metadata["branch"],
-                },
-                depends_on=["initialize_state"],
+                id=t.id,
+                action=t.action,
+                params={key: values[key] for key in t.params},
+                depends_on=list(t.depends_on),
             )
-        )
-
-    @staticmethod
-    def _extract_repo_name(repo: str) -> str:
-        """Extract a short repo name from a path or URL."""
-        # Handle URLs like https://github.com/user/repo.git
-        if repo.startswith(("http://", "https://", "git@")):
-            name = repo.rstrip("/").rsplit("/", 1)[-1]
-            if name.endswith(".git"):
-                name = name[:-4]
-            return name
+            for t in templates
+        ]
 
-        # Handle local paths
-        path = Path(repo)
-        return path.name or path.parent.name
+    _extract_repo_name = staticmethod(_extract_repo_name)
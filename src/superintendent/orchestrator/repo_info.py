@@ -1,10 +1,27 @@
 """RepoInfo: analyzes a repository to inform execution strategy decisions."""
 
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
 
+_DOCKER_INDICATORS = frozenset(
+    {
+        "Dockerfile",
+        "docker-compose.yml",
+        "docker-compose.yaml",
+        "compose.yml",
+        "compose.yaml",
+    }
+)
+_ENV_INDICATORS = frozenset({".env", ".env.example", ".env.local", ".env.sample"})
+_AUTH_INDICATORS = frozenset({".npmrc", "pip.conf", ".pypirc"})
+_PYTHON_INDICATORS = frozenset(
+    {"pyproject.toml", "setup.py", "setup.cfg", "requirements.txt", "Pipfile"}
+)
+_JAVA_INDICATORS = frozenset({"pom.xml", "build.gradle", "build.gradle.kts"})
+
 
-@dataclass
+@dataclass(slots=True)
 class RepoInfo:
     """Gathered context about a repository for strategy decisions."""
 
@@ -23,11 +40,12 @@ class RepoInfo:
         if not repo.is_dir():
             raise ValueError(f"Repository path is not a directory: {repo}")
 
-        has_dockerfile = _detect_dockerfile(repo)
-        has_devcontainer = _detect_devcontainer(repo)
-        has_env_file = _detect_env_file(repo)
-        needs_auth = _detect_auth_needs(repo)
-        languages = _detect_languages(repo)
+        entries = _scan_entries(repo)
+        has_dockerfile = _detect_dockerfile(entries)
+        has_devcontainer = _detect_devcontainer(entries)
+        has_env_file = _detect_env_file(entries)
+        needs_auth = _detect_auth_needs(entries)
+        languages = _detect_languages(entries)
         estimated_complexity = _estimate_complexity(
             has_dockerfile=has_dockerfile,
             has_devcontainer=has_devcontainer,
@@ -46,74 +64,65 @@ class RepoInfo:
         )
 
 
-def _detect_dockerfile(repo: Path) -> bool:
+def _scan_entries(repo: Path) -> dict[str, os.DirEntry[str]]:
+    """List the repo root once, keyed by entry name.
+
+    All indicator checks below are membership tests against this mapping,
+    so detection costs one directory read instead of a stat per filename.
+    File types are left to the DirEntry and only queried where needed.
+    """
+    with os.scandir(repo) as it:
+        return {entry.name: entry for entry in it}
+
+
+def _detect_dockerfile(entries: dict[str, os.DirEntry[str]]) -> bool:
     """Check for Dockerfile or docker-compose files."""
-    indicators = [
-        "Dockerfile",
-        "docker-compose.yml",
-        "docker-compose.yaml",
-        "compose.yml",
-        "compose.yaml",
-    ]
-    return any((repo / name).exists() for name in indicators)
+    return not entries.keys().isdisjoint(_DOCKER_INDICATORS)
 
 
-def _detect_devcontainer(repo: Path) -> bool:
+def _detect_devcontainer(entries: dict[str, os.DirEntry[str]]) -> bool:
     """Check for .devcontainer directory."""
-    devcontainer_dir = repo / ".devcontainer"
-    return devcontainer_dir.is_dir()
+    entry = entries.get(".devcontainer")
+    return entry is not None and entry.is_dir()
 
 
-def _detect_env_file(repo: Path) -> bool:
+def _detect_env_file(entries: dict[str, os.DirEntry[str]]) -> bool:
     """Check for .env or .env.example files."""
-    indicators = [".env", ".env.example", ".env.local", ".env.sample"]
-    return any((repo / name).exists() for name in indicators)
+    return not entries.keys().isdisjoint(_ENV_INDICATORS)
 
 
-def _detect_auth_needs(repo: Path) -> bool:
+def _detect_auth_needs(entries: dict[str, os.DirEntry[str]]) -> bool:
     """Check for files that suggest authentication requirements."""
-    auth_indicators = [
-        ".npmrc",
-        "pip.conf",
-        ".pypirc",
-    ]
-    return any((repo / name).exists() for name in auth_indicators)
+    return not entries.keys().isdisjoint(_AUTH_INDICATORS)
 
 
-def _detect_languages(repo: Path) -> list[str]:
+def _detect_languages(entries: dict[str, os.DirEntry[str]]) -> list[str]:
     """Detect programming languages used in the repo."""
     languages: list[str] = []
+    names = entries.keys()
 
     # Python indicators
-    python_indicators = [
-        "pyproject.toml",
-        "setup.py",
-        "setup.cfg",
-        "requirements.txt",
-        "Pipfile",
-    ]
-    if any((repo / name).exists() for name in python_indicators):
+    if not names.isdisjoint(_PYTHON_INDICATORS):
         languages.append("python")
 
     # JavaScript indicators
-    if (repo / "package.json").exists():
+    if "package.json" in entries:
         languages.append("javascript")
 
     # TypeScript indicators
-    if (repo / "tsconfig.json").exists():
+    if "tsconfig.json" in entries:
         languages.append("typescript")
 
     # Rust indicators
-    if (repo / "Cargo.toml").exists():
+    if "Cargo.toml" in entries:
         languages.append("rust")
 
     # Go indicators
-    if (repo / "go.mod").exists():
+    if "go.mod" in entries:
         languages.append("go")
 
     # Java indicators
-    java_indicators = ["pom.xml", "build.gradle", "build.gradle.kts"]
-    if any((repo / name).exists() for name in java_indicators):
+    if not names.isdisjoint(_JAVA_INDICATORS):
         languages.append("java")
 
     return languages
@@ -128,16 +137,14 @@ def _estimate_complexity(
     languages: list[str],
 ) -> str:
     """Estimate repo complexity based on detected characteristics."""
-    score = 0
-    if has_dockerfile:
-        score += 1
-    if has_devcontainer:
-        score += 1
-    if has_env_file:
-        score += 1
-    if needs_auth:
-        score += 1
-    score += max(0, len(languages) - 1)  # multiple languages add complexity
+    # Each detected characteristic adds one; extra languages add one each
+    score = (
+        has_dockerfile
+        + has_devcontainer
+        + has_env_file
+        + needs_auth
+        + max(0, len(languages) - 1)
+    )
 
     if score >= 3:
         return "complex"
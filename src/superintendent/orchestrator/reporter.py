@@ -4,8 +4,9 @@ Follows the Real/Mock/DryRun pattern used by all backends.
 The Orchestrator calls reporter methods as agents start, complete, or fail.
 """
 
+import sys
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
 from typing import Any, Protocol, runtime_checkable
 
 
@@ -16,7 +17,8 @@ class AgentEvent:
     event_type: str
     agent_id: str
     data: dict[str, Any] = field(default_factory=dict)
-    timestamp: datetime | None = None
+    # time.monotonic_ns() at emission; set by the reporter that records it
+    timestamp_ns: int = 0
 
 
 @runtime_checkable
@@ -66,6 +68,14 @@ class Reporter(Protocol):
         ...
 
 
+def _emit(line: str, flush: bool = False) -> None:
+    """Write one line to stdout, looked up per call so redirection still works."""
+    out = sys.stdout
+    out.write(line + "\n")
+    if flush:
+        out.flush()
+
+
 class RealReporter:
     """Reports progress to the terminal."""
 
@@ -74,7 +84,7 @@ class RealReporter:
     ) -> None:
         tasks_str = ", ".join(task_names)
         location = f" in {sandbox_name}" if sandbox_name else ""
-        print(f"[started] Agent {agent_id}{location} (tasks: {tasks_str})")
+        _emit(f"[started] Agent {agent_id}{location} (tasks: {tasks_str})")
 
     def on_agent_completed(
         self, agent_id: str, task_names: list[str], duration_seconds: float
@@ -82,13 +92,16 @@ class RealReporter:
         tasks_str = ", ".join(task_names)
         minutes = duration_seconds / 60
         time_str = f"{minutes:.1f}m" if minutes >= 1 else f"{duration_seconds:.0f}s"
-        print(
+        _emit(
             f"[completed] Agent {agent_id} completed in {time_str} (tasks: {tasks_str})"
         )
 
     def on_agent_failed(self, agent_id: str, task_names: list[str], error: str) -> None:
         tasks_str = ", ".join(task_names)
-        print(f"[FAILED] Agent {agent_id} FAILED (tasks: {tasks_str}): {error}")
+        _emit(
+            f"[FAILED] Agent {agent_id} FAILED (tasks: {tasks_str}): {error}",
+            flush=True,
+        )
 
     def on_progress(
         self,
@@ -98,7 +111,7 @@ class RealReporter:
         failed: int,
     ) -> None:
         total = running + completed + pending + failed
-        print(
+        _emit(
             f"[progress] {completed}/{total} completed, "
             f"{running} running, {pending} pending, {failed} failed"
         )
@@ -112,29 +125,24 @@ class RealReporter:
         total_time_seconds: float,
         errors: list[str],
     ) -> str:
-        lines = ["--- Orchestration Summary ---"]
         minutes = total_time_seconds / 60
-        if minutes >= 1:
-            lines.append(f"Total time: {minutes:.1f}m")
-        else:
-            lines.append(f"Total time: {total_time_seconds:.0f}s")
-        lines.append(f"Agents spawned: {agents_spawned}")
-        lines.append(f"Completed: {len(completed_tasks)} tasks")
-        if completed_tasks:
-            for t in completed_tasks:
-                lines.append(f"  - {t}")
+        time_str = f"{minutes:.1f}m" if minutes >= 1 else f"{total_time_seconds:.0f}s"
+        lines = [
+            "--- Orchestration Summary ---",
+            f"Total time: {time_str}",
+            f"Agents spawned: {agents_spawned}",
+            f"Completed: {len(completed_tasks)} tasks",
+            *(f"  - {t}" for t in completed_tasks),
+        ]
         if failed_tasks:
             lines.append(f"Failed: {len(failed_tasks)} tasks")
-            for t in failed_tasks:
-                lines.append(f"  - {t}")
+            lines.extend(f"  - {t}" for t in failed_tasks)
         if skipped_tasks:
             lines.append(f"Skipped: {len(skipped_tasks)} tasks")
-            for t in skipped_tasks:
-                lines.append(f"  - {t}")
+            lines.extend(f"  - {t}" for t in skipped_tasks)
         if errors:
             lines.append(f"Errors ({len(errors)}):")
-            for e in errors:
-                lines.append(f"  - {e}")
+            lines.extend(f"  - {e}" for e in errors)
         return "\n".join(lines)
 
 
@@ -152,7 +160,8 @@ class MockReporter:
             AgentEvent(
                 event_type="started",
                 agent_id=agent_id,
-                data={"task_names": task_names, "sandbox_name": sandbox_name},
+                timestamp_ns=time.monotonic_ns(),
+                data={"task_names": tuple(task_names), "sandbox_name": sandbox_name},
             )
         )
 
@@ -163,7 +172,11 @@ class MockReporter:
             AgentEvent(
                 event_type="completed",
                 agent_id=agent_id,
-                data={"task_names": task_names, "duration_seconds": duration_seconds},
+                timestamp_ns=time.monotonic_ns(),
+                data={
+                    "task_names": tuple(task_names),
+                    "duration_seconds": duration_seconds,
+                },
             )
         )
 
@@ -172,7 +185,8 @@ class MockReporter:
             AgentEvent(
                 event_type="failed",
                 agent_id=agent_id,
-                data={"task_names": task_names, "error": error},
+                timestamp_ns=time.monotonic_ns(),
+                data={"task_names": tuple(task_names), "error": error},
             )
         )
 
@@ -187,6 +201,7 @@ class MockReporter:
             AgentEvent(
                 event_type="progress",
                 agent_id="",
+                timestamp_ns=time.monotonic_ns(),
                 data={
                     "running": running,
                     "completed": completed,
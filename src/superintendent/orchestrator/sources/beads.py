@@ -1,12 +1,15 @@
 """BeadsSource — native, first-class task source backed by the beads CLI."""
 
 import json
+import os
 import subprocess
+import time
+from collections.abc import Iterable, Sequence
 from pathlib import Path
 from typing import Any
 
 from .models import Task, TaskStatus
-from .protocol import TaskSource
+from .protocol import RepoEntries, TaskSource, scan_repo_root
 
 # Map beads status strings to TaskStatus
 _STATUS_MAP: dict[str, TaskStatus] = {
@@ -15,6 +18,17 @@ _STATUS_MAP: dict[str, TaskStatus] = {
     "in_progress": TaskStatus.in_progress,
 }
 
+# Fixed argument tuples for bd queries; they double as query cache keys
+_BD_LIST = ("list", "--json")
+_BD_READY = ("ready", "--json")
+
+# bd verb and trailing flags for each status update; task IDs go in between
+_STATUS_COMMANDS: dict[TaskStatus, tuple[str, tuple[str, ...]]] = {
+    TaskStatus.completed: ("close", ("--message", "Completed by agent")),
+    TaskStatus.in_progress: ("update", ("--claim",)),
+    TaskStatus.failed: ("update", ("--set", "status=failed")),
+}
+
 
 class BeadsSource(TaskSource):
     """Task source backed by the beads (bd) CLI.
@@ -23,98 +37,139 @@ class BeadsSource(TaskSource):
     All operations delegate to the bd CLI, which must be available on PATH.
     """
 
+    __slots__ = ("_repo_root", "_cache_ttl", "_query_cache")
+
     source_name = "beads"
 
     @classmethod
-    def can_handle(cls, repo_root: Path) -> bool:
-        beads_dir = repo_root / ".beads"
-        return beads_dir.is_dir() and (beads_dir / "issues.jsonl").exists()
+    def can_handle(cls, repo_root: Path, entries: RepoEntries | None = None) -> bool:
+        if entries is None:
+            entries = scan_repo_root(repo_root)
+        beads_dir = entries.get(".beads")
+        return (
+            beads_dir is not None
+            and beads_dir.is_dir()
+            and os.path.exists(os.path.join(beads_dir.path, "issues.jsonl"))
+        )
 
-    def __init__(self, repo_root: Path) -> None:
+    def __init__(self, repo_root: Path, cache_ttl: float = 1.0) -> None:
         self._repo_root = repo_root
+        # Parsed JSON of recent bd queries, keyed by args, so polls within
+        # one scheduler tick don't each fork bd. 0 disables the cache.
+        self._cache_ttl = cache_ttl
+        self._query_cache: dict[tuple[str, ...], tuple[float, Any]] = {}
 
     def get_tasks(self) -> list[Task]:
         """Get all tasks via ``bd list --json``."""
-        result = self._run_bd(["list", "--json"])
+        result = self._run_bd(_BD_LIST)
         if result is None:
             return []
         return [self._parse_bead(bead) for bead in result]
 
     def get_ready_tasks(self) -> list[Task]:
         """Get ready (unblocked) tasks via ``bd ready --json``."""
-        result = self._run_bd(["ready", "--json"])
+        result = self._run_bd(_BD_READY)
         if result is None:
             return []
         return [self._parse_bead(bead) for bead in result]
 
     def update_status(self, task_id: str, status: TaskStatus) -> None:
         """Update task status via bd commands."""
-        if status == TaskStatus.completed:
-            self._run_bd_raw(["close", task_id, "--message", "Completed by agent"])
-        elif status == TaskStatus.in_progress:
-            self._run_bd_raw(["update", task_id, "--claim"])
-        elif status == TaskStatus.failed:
-            self._run_bd_raw(["update", task_id, "--set", "status=failed"])
+        self.update_statuses([(task_id, status)])
+
+    def update_statuses(self, updates: Iterable[tuple[str, TaskStatus]]) -> None:
+        """Update many tasks with one bd invocation per target status.
+
+        ``bd close`` and ``bd update`` accept several IDs, so N updates
+        cost at most one process per distinct status instead of N.
+        """
+        ids_by_status: dict[TaskStatus, list[str]] = {}
+        for task_id, status in updates:
+            if status in _STATUS_COMMANDS:
+                ids_by_status.setdefault(status, []).append(task_id)
+        for status, task_ids in ids_by_status.items():
+            verb, flags = _STATUS_COMMANDS[status]
+            self._run_bd_raw((verb, *task_ids, *flags))
 
     def claim_task(self, task_id: str) -> bool:
         """Claim a task via ``bd update --claim``."""
-        result = subprocess.run(
-            ["bd", "update", task_id, "--claim"],
-            capture_output=True,
-            text=True,
-            cwd=self._repo_root,
-        )
-        return result.returncode == 0
-
-    def _run_bd(self, args: list[str]) -> list[dict[str, Any]] | None:
-        """Run a bd command that returns JSON, parse and return the result."""
-        result = subprocess.run(
+        return self._run_bd_raw(("update", task_id, "--claim"))
+
+    def invalidate(self) -> None:
+        """Forget cached query results so the next read runs bd again."""
+        self._query_cache.clear()
+
+    def _bd(
+        self, args: Sequence[str], capture: bool = False
+    ) -> subprocess.CompletedProcess[bytes]:
+        """Run one bd command in the repo root.
+
+        Every bd call goes through here so the transport lives in one place.
+        stdout is piped back as raw bytes only when ``capture`` is set;
+        otherwise, like stderr, it goes to DEVNULL.
+        """
+        return subprocess.run(
             ["bd", *args],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             cwd=self._repo_root,
         )
+
+    def _run_bd(self, args: tuple[str, ...]) -> list[dict[str, Any]] | None:
+        """Run a bd command that returns JSON, parse and return the result.
+
+        Successful results are reused for cache_ttl seconds. Only the raw
+        JSON is cached; callers build fresh Task objects from it.
+        """
+        now = time.monotonic()
+        cached = self._query_cache.get(args)
+        if cached is not None and now - cached[0] < self._cache_ttl:
+            return cached[1]
+        result = self._bd(args, capture=True)
         if result.returncode != 0:
             return None
         try:
-            return json.loads(result.stdout)
+            # json.loads decodes the UTF-8 bytes itself
+            parsed = json.loads(result.stdout)
         except (json.JSONDecodeError, ValueError):
             return None
+        if self._cache_ttl > 0:
+            self._query_cache[args] = (now, parsed)
+        return parsed
 
-    def _run_bd_raw(self, args: list[str]) -> bool:
-        """Run a bd command and return success/failure."""
-        result = subprocess.run(
-            ["bd", *args],
-            capture_output=True,
-            text=True,
-            cwd=self._repo_root,
-        )
-        return result.returncode == 0
+    def _run_bd_raw(self, args: Sequence[str]) -> bool:
+        """Run a mutating bd command and return success/failure."""
+        self.invalidate()
+        return self._bd(args).returncode == 0
 
     @staticmethod
     def _parse_bead(bead: dict[str, Any]) -> Task:
         """Convert a bead JSON object to a Task."""
         bead_id = bead["id"]
-        status = _STATUS_MAP.get(bead.get("status", "open"), TaskStatus.pending)
+        get = bead.get
+        # An absent status maps to pending, the same as "open"
+        status = _STATUS_MAP.get(get("status"), TaskStatus.pending)
 
         # Parse dependencies from the bead dependency list
-        dependencies: list[str] = []
-        for dep in bead.get("dependencies", []):
-            depends_on = dep.get("depends_on_id", "")
-            if depends_on:
-                dependencies.append(depends_on)
+        dependencies = [
+            depends_on
+            for dep in get("dependencies") or ()
+            if (depends_on := dep.get("depends_on_id"))
+        ]
 
         # Parse labels: beads uses "key:value" format in label list
-        labels: dict[str, str] = {}
-        for label in bead.get("labels", []):
-            if ":" in label:
-                key, value = label.split(":", 1)
-                labels[key] = value
+        labels = {
+            key: value
+            for key, sep, value in (
+                label.partition(":") for label in get("labels") or ()
+            )
+            if sep
+        }
 
         return Task(
             task_id=bead_id,
             title=bead["title"],
-            description=bead.get("description", ""),
+            description=get("description") or "",
             status=status,
             dependencies=dependencies,
             labels=labels,
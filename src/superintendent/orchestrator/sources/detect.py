@@ -4,7 +4,7 @@ from pathlib import Path
 
 from .beads import BeadsSource
 from .markdown import MarkdownSource
-from .protocol import TaskSource
+from .protocol import TaskSource, scan_repo_root
 from .single import SingleTaskSource
 from .speckit import SpecKitSource
 
@@ -55,9 +55,11 @@ def detect_source(
             return source_cls.create(repo_root)
         return None
 
-    # Auto-detection: check each source in priority order
+    # Auto-detection: list repo_root once, then check each source in
+    # priority order against that listing
+    entries = scan_repo_root(repo_root)
     for source_cls in _AUTO_DETECT_ORDER:
-        if source_cls.can_handle(repo_root):
+        if source_cls.can_handle(repo_root, entries):
             return source_cls.create(repo_root)
 
     # Fallback to single task if a description was provided
@@ -1,16 +1,60 @@
 """MarkdownSource — parse tasks from a markdown checklist file."""
 
+import functools
 import re
 from pathlib import Path
+from typing import NamedTuple
 
 from .models import Task, TaskStatus
-from .protocol import TaskSource
+from .protocol import RepoEntries, TaskSource, scan_repo_root
 
-# Matches lines like: "- [ ] Task" or "- [x] Task" or "- [ ] [T001] Task"
-_TASK_PATTERN = re.compile(r"^(\s*)-\s+\[([ xX])\]\s+(?:\[([^\]]+)\]\s+)?(.+)$")
+# Matches lines like: "- [ ] Task" or "- [x] Task" or "- [ ] [T001] Task".
+# [^\S\n] keeps each match on a single line. Matches begin at the newline
+# before the line (scan "\n" + content): with a literal first character the
+# regex engine skips straight to candidate positions instead of attempting a
+# match at every offset.
+_TASK_PATTERN = re.compile(
+    r"\n([^\S\n]*)-[^\S\n]+\[([ xX])\][^\S\n]+(?:\[([^\]\n]+)\][^\S\n]+)?(.+)"
+)
 
 
-_MARKDOWN_CANDIDATES = ["tasks.md", "TODO.md"]
+_MARKDOWN_CANDIDATES = ("tasks.md", "TODO.md")
+
+
+def _find_task_file(repo_root: Path) -> Path | None:
+    """Return the first candidate task file present in repo_root, if any.
+
+    Uses the same is_file() test as can_handle, so a directory named like a
+    candidate is skipped in both.
+    """
+    for name in _MARKDOWN_CANDIDATES:
+        path = repo_root / name
+        if path.is_file():
+            return path
+    return None
+
+
+class _ParsedFile(NamedTuple):
+    """A task file's content and the parse of exactly that content."""
+
+    content: str
+    tasks: list[Task]
+    # Unchecked tasks whose dependencies are all completed
+    ready: list[Task]
+    # task_id -> offsets of its checkbox character in content
+    checkboxes: dict[str, list[int]]
+
+
+@functools.lru_cache(maxsize=4096)
+def _make_id(text: str) -> str:
+    """Generate a stable ID from task text.
+
+    Cached because parse and update_status hash the same lines repeatedly.
+    """
+    import hashlib
+
+    digest = hashlib.sha256(text.strip().encode()).hexdigest()[:8]
+    return f"md-{digest}"
 
 
 class MarkdownSource(TaskSource):
@@ -23,77 +67,102 @@ class MarkdownSource(TaskSource):
     - Status update toggles checkboxes in the file
     """
 
+    __slots__ = ("_path", "_cache")
+
     source_name = "markdown"
 
     @classmethod
-    def can_handle(cls, repo_root: Path) -> bool:
-        return any((repo_root / name).exists() for name in _MARKDOWN_CANDIDATES)
+    def can_handle(cls, repo_root: Path, entries: RepoEntries | None = None) -> bool:
+        if entries is None:
+            entries = scan_repo_root(repo_root)
+        return any(
+            name in entries and entries[name].is_file() for name in _MARKDOWN_CANDIDATES
+        )
 
     @classmethod
     def create(cls, repo_root: Path) -> "MarkdownSource":
-        for name in _MARKDOWN_CANDIDATES:
-            path = repo_root / name
-            if path.exists():
-                return cls(path)
-        raise FileNotFoundError("No markdown task file found")
+        path = _find_task_file(repo_root)
+        if path is None:
+            raise FileNotFoundError("No markdown task file found")
+        return cls(path)
 
     def __init__(self, path: Path) -> None:
         self._path = path
+        # Last parse of the file, reused while its content is unchanged
+        self._cache: _ParsedFile | None = None
 
     def get_tasks(self) -> list[Task]:
-        """Parse all checklist items from the markdown file."""
-        content = self._path.read_text()
-        return self._parse_tasks(content)
+        """Parse all checklist items, reusing the last parse if unchanged.
+
+        Returns copies, so callers may mutate them without touching the cache.
+        """
+        return [t.copy() for t in self._load().tasks]
 
     def get_ready_tasks(self) -> list[Task]:
         """Return unchecked tasks whose parent dependencies are completed."""
-        tasks = self.get_tasks()
+        return [t.copy() for t in self._load().ready]
+
+    def update_status(self, task_id: str, status: TaskStatus) -> None:
+        """Toggle the checkbox in the markdown file to reflect new status.
+
+        Splices the checkbox character at the offsets recorded by the last
+        parse instead of re-reading and re-matching the file.
+        """
+        parsed = self._load()
+        offsets = parsed.checkboxes.get(task_id)
+        if not offsets:
+            return
+        check = "x" if status == TaskStatus.completed else " "
+        content = parsed.content
+        for offset in offsets:
+            content = f"{content[:offset]}{check}{content[offset + 1 :]}"
+        if content != parsed.content:
+            self._path.write_text(content)
+            self._cache = None
+
+    def _load(self) -> _ParsedFile:
+        """Return the parsed file, re-parsing it only if its content changed.
+
+        The cache is keyed on the content itself, not on stat: flipping a
+        checkbox keeps the size, and can land in the same mtime tick as
+        the last read on filesystems with coarse timestamps.
+        """
+        content = self._path.read_text()
+        if self._cache is not None and self._cache.content == content:
+            return self._cache
+        checkboxes: dict[str, list[int]] = {}
+        tasks = self._parse_tasks(content, checkboxes)
         completed_ids = {t.task_id for t in tasks if t.status == TaskStatus.completed}
-        return [
+        ready = [
             t
             for t in tasks
             if t.status != TaskStatus.completed and not t.is_blocked(completed_ids)
         ]
-
-    def update_status(self, task_id: str, status: TaskStatus) -> None:
-        """Toggle the checkbox in the markdown file to reflect new status."""
-        content = self._path.read_text()
-        lines = content.splitlines()
-        new_lines: list[str] = []
-        changed = False
-
-        for line in lines:
-            match = _TASK_PATTERN.match(line)
-            if match:
-                indent, _checkbox, explicit_id, text = match.groups()
-                line_task_id = explicit_id or self._make_id(text)
-                if line_task_id == task_id:
-                    check = "x" if status == TaskStatus.completed else " "
-                    id_part = f"[{explicit_id}] " if explicit_id else ""
-                    line = f"{indent}- [{check}] {id_part}{text}"
-                    changed = True
-            new_lines.append(line)
-
-        if changed:
-            self._path.write_text("\n".join(new_lines) + "\n")
+        self._cache = _ParsedFile(content, tasks, ready, checkboxes)
+        return self._cache
 
     # task_id is required by the ABC interface but unused in this no-op impl
     def claim_task(self, task_id: str) -> bool:  # noqa: ARG002
         return True
 
-    def _parse_tasks(self, content: str) -> list[Task]:
+    def _parse_tasks(
+        self, content: str, checkboxes: dict[str, list[int]] | None = None
+    ) -> list[Task]:
+        """Parse tasks from content.
+
+        If ``checkboxes`` is given, it is filled with task_id -> offsets of
+        that task's checkbox character in ``content``.
+        """
         tasks: list[Task] = []
         # Stack of (indent_level, task_id) to track nesting
         parent_stack: list[tuple[int, str]] = []
 
-        for line in content.splitlines():
-            match = _TASK_PATTERN.match(line)
-            if not match:
-                continue
-
+        for match in _TASK_PATTERN.finditer("\n" + content):
             indent, checkbox, explicit_id, text = match.groups()
             indent_level = len(indent)
             task_id = explicit_id or self._make_id(text)
+            if checkboxes is not None:
+                checkboxes.setdefault(task_id, []).append(match.start(2) - 1)
             status = (
                 TaskStatus.completed if checkbox in ("x", "X") else TaskStatus.pending
             )
@@ -121,10 +190,4 @@ class MarkdownSource(TaskSource):
 
         return tasks
 
-    @staticmethod
-    def _make_id(text: str) -> str:
-        """Generate a stable ID from task text."""
-        import hashlib
-
-        digest = hashlib.sha256(text.strip().encode()).hexdigest()[:8]
-        return f"md-{digest}"
+    _make_id = staticmethod(_make_id)
@@ -14,7 +14,7 @@ class TaskStatus(StrEnum):
     failed = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """A unified task representation across all task sources."""
 
@@ -28,14 +28,26 @@ class Task:
 
     def is_blocked(self, completed_ids: set[str]) -> bool:
         """Return True if this task has unmet dependencies."""
-        return bool(set(self.dependencies) - completed_ids)
+        return not completed_ids.issuperset(self.dependencies)
+
+    def copy(self) -> "Task":
+        """Return an independent copy with its own dependencies and labels."""
+        return Task(
+            self.task_id,
+            self.title,
+            self.description,
+            self.status,
+            list(self.dependencies),
+            dict(self.labels),
+            self.source_ref,
+        )
 
     def to_dict(self) -> dict[str, Any]:
         return {
             "task_id": self.task_id,
             "title": self.title,
             "description": self.description,
-            "status": str(self.status),
+            "status": self.status.value,
             "dependencies": self.dependencies,
             "labels": self.labels,
             "source_ref": self.source_ref,
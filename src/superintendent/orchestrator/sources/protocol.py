@@ -1,10 +1,27 @@
 """TaskSource abstract base class definition."""
 
+import os
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Mapping
 from pathlib import Path
 
 from .models import Task, TaskStatus
 
+# Top-level directory listing of a repo, keyed by entry name
+RepoEntries = Mapping[str, os.DirEntry[str]]
+
+
+def scan_repo_root(repo_root: Path) -> dict[str, os.DirEntry[str]]:
+    """List repo_root once so detection can test many names without re-stat.
+
+    Returns an empty dict if repo_root cannot be read.
+    """
+    try:
+        with os.scandir(repo_root) as it:
+            return {entry.name: entry for entry in it}
+    except OSError:
+        return {}
+
 
 class TaskSource(ABC):
     """Base class for task source backends.
@@ -17,14 +34,22 @@ class TaskSource(ABC):
     to participate in auto-detection via ``detect_source()``.
     """
 
+    __slots__ = ()
+
     source_name: str = ""
 
     @classmethod
-    # repo_root is needed by subclass overrides but unused in the default impl
-    def can_handle(cls, repo_root: Path) -> bool:  # noqa: ARG003
+    # arguments are needed by subclass overrides but unused in the default impl
+    def can_handle(
+        cls,
+        repo_root: Path,  # noqa: ARG003
+        entries: RepoEntries | None = None,  # noqa: ARG003
+    ) -> bool:
         """Return True if this source can provide tasks for the given repo.
 
         Override in subclasses to participate in auto-detection.
+        ``entries`` is an optional pre-scanned listing of repo_root (see
+        ``scan_repo_root``) shared across sources by ``detect_source()``.
         The default returns False (opt-in).
         """
         return False
@@ -53,6 +78,15 @@ class TaskSource(ABC):
         """Update the status of a task in the backing store."""
         ...
 
+    def update_statuses(self, updates: Iterable[tuple[str, TaskStatus]]) -> None:
+        """Apply several status updates at once.
+
+        The default calls update_status for each pair. Sources whose
+        backing store supports multi-task updates override this to batch.
+        """
+        for task_id, status in updates:
+            self.update_status(task_id, status)
+
     @abstractmethod
     def claim_task(self, task_id: str) -> bool:
         """Claim a task for this agent. Returns True on success."""
@@ -14,6 +14,8 @@ class SingleTaskSource(TaskSource):
     Not auto-detected — used as explicit fallback when a task string is provided.
     """
 
+    __slots__ = ("_description", "_task_id")
+
     source_name = "single"
 
     def __init__(self, description: str, task_id: str | None = None) -> None:
@@ -1,27 +1,40 @@
 """SpecKitSource — parse tasks from spec-kit's tasks.md format."""
 
+import mmap
 import re
 from pathlib import Path
+from typing import NamedTuple
 
 from .models import Task, TaskStatus
-from .protocol import TaskSource
+from .protocol import RepoEntries, TaskSource, scan_repo_root
 
-# Matches: - [ ] [T001] [P] [US1] Task description
-# or:      - [x] [T002] [US1] Task description (no parallel marker)
-# Groups: checkbox, task_id, rest_of_line
-_SPECKIT_LINE = re.compile(r"^-\s+\[([ xX])\]\s+\[([^\]]+)\]\s+(.+)$")
+# One scan per line: either a phase header (## Phase N: Name, ## Setup, ...)
+# or a task line such as "- [ ] [T001] [P] [US1] Task description", where
+# the [P] parallel marker and [USN] story label are optional.
+# [^\S\n] keeps whitespace runs from crossing line boundaries.
+# Matches begin at the newline before the line (scan "\n" + content): with
+# a literal first character the regex engine skips straight to candidate
+# positions instead of attempting a match at every offset.
+_SPECKIT_ENTRY = re.compile(
+    r"\n(?:##[^\S\n]+(?:Phase[^\S\n]+\d+:[^\S\n]+)?(?P<phase>.+)"
+    r"|-[^\S\n]+\[(?P<check>[ xX])\][^\S\n]+\[(?P<id>[^\]\n]+)\][^\S\n]+"
+    r"(?P<par>\[P\][^\S\n]+)?(?:\[US(?P<story>\d+)\][^\S\n]+)?(?P<desc>.+))"
+)
 
-# Detect [P] parallel marker at the start of rest_of_line
-_PARALLEL_MARKER = re.compile(r"^\[P\]\s+(.+)$")
+# Full spec-kit detection: at least one line matching the full pattern.
+# A bytes pattern so can_handle can search an mmap of the file directly.
+_SPECKIT_DETECT = re.compile(rb"^-\s+\[[ xX]\]\s+\[T\d+\]\s+", re.MULTILINE)
 
-# Detect [USN] story label
-_STORY_LABEL = re.compile(r"^\[US(\d+)\]\s+(.+)$")
 
-# Phase header: ## Phase N: Name or ## Setup, ## Foundation, etc.
-_PHASE_HEADER = re.compile(r"^##\s+(?:Phase\s+\d+:\s+)?(.+)$")
+class _ParsedFile(NamedTuple):
+    """A task file's content and the parse of exactly that content."""
 
-# Full spec-kit detection: at least one line matching the full pattern
-_SPECKIT_DETECT = re.compile(r"^-\s+\[[ xX]\]\s+\[T\d+\]\s+", re.MULTILINE)
+    content: str
+    tasks: list[Task]
+    # Unchecked tasks whose dependencies are all completed
+    ready: list[Task]
+    # task_id -> offsets of its checkbox character in content
+    checkboxes: dict[str, list[int]]
 
 
 class SpecKitSource(TaskSource):
@@ -35,19 +48,29 @@ class SpecKitSource(TaskSource):
     - Dependency inference: sequential tasks within a story depend on predecessors
     """
 
+    __slots__ = ("_path", "_cache")
+
     source_name = "speckit"
 
     @classmethod
-    def can_handle(cls, repo_root: Path) -> bool:
+    def can_handle(cls, repo_root: Path, entries: RepoEntries | None = None) -> bool:
         """Detect spec-kit format by checking tasks.md for [T001] patterns."""
-        tasks_md = repo_root / "tasks.md"
-        if not tasks_md.exists():
+        if entries is None:
+            entries = scan_repo_root(repo_root)
+        tasks_md = entries.get("tasks.md")
+        if tasks_md is None:
             return False
+        # Search the mapped file so only the pages up to the first task
+        # line are read, and nothing is decoded
         try:
-            content = tasks_md.read_text()
-        except OSError:
+            with (
+                open(tasks_md.path, "rb") as f,
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf,
+            ):
+                return _SPECKIT_DETECT.search(buf) is not None
+        except (OSError, ValueError):
+            # ValueError: an empty file cannot be mapped
             return False
-        return bool(_SPECKIT_DETECT.search(content))
 
     @classmethod
     def create(cls, repo_root: Path) -> "SpecKitSource":
@@ -55,80 +78,91 @@ class SpecKitSource(TaskSource):
 
     def __init__(self, path: Path) -> None:
         self._path = path
+        # Last parse of the file, reused while its content is unchanged
+        self._cache: _ParsedFile | None = None
 
     def get_tasks(self) -> list[Task]:
-        content = self._path.read_text()
-        return self._parse_tasks(content)
+        """Parse tasks, reusing the last parse while the file is unchanged.
+
+        Returns copies, so callers may mutate them without touching the cache.
+        """
+        return [t.copy() for t in self._load().tasks]
 
     def get_ready_tasks(self) -> list[Task]:
-        tasks = self.get_tasks()
+        return [t.copy() for t in self._load().ready]
+
+    def update_status(self, task_id: str, status: TaskStatus) -> None:
+        """Toggle the task's checkbox in tasks.md to reflect new status.
+
+        Splices the checkbox character at the offsets recorded by the last
+        parse instead of re-reading and re-matching the file.
+        """
+        parsed = self._load()
+        offsets = parsed.checkboxes.get(task_id)
+        if not offsets:
+            return
+        check = "x" if status == TaskStatus.completed else " "
+        content = parsed.content
+        for offset in offsets:
+            content = f"{content[:offset]}{check}{content[offset + 1 :]}"
+        if content != parsed.content:
+            self._path.write_text(content)
+            self._cache = None
+
+    def _load(self) -> _ParsedFile:
+        """Return the parsed file, re-parsing it only if its content changed.
+
+        The cache is keyed on the content itself, not on stat: flipping a
+        checkbox keeps the size, and can land in the same mtime tick as
+        the last read on filesystems with coarse timestamps.
+        """
+        content = self._path.read_text()
+        if self._cache is not None and self._cache.content == content:
+            return self._cache
+        checkboxes: dict[str, list[int]] = {}
+        tasks = self._parse_tasks(content, checkboxes)
         completed_ids = {t.task_id for t in tasks if t.status == TaskStatus.completed}
-        return [
+        ready = [
             t
             for t in tasks
             if t.status != TaskStatus.completed and not t.is_blocked(completed_ids)
         ]
-
-    def update_status(self, task_id: str, status: TaskStatus) -> None:
-        content = self._path.read_text()
-        lines = content.splitlines()
-        new_lines: list[str] = []
-        changed = False
-
-        for line in lines:
-            match = _SPECKIT_LINE.match(line)
-            if match:
-                _checkbox, line_id, rest = match.groups()
-                if line_id == task_id:
-                    check = "x" if status == TaskStatus.completed else " "
-                    line = f"- [{check}] [{line_id}] {rest}"
-                    changed = True
-            new_lines.append(line)
-
-        if changed:
-            self._path.write_text("\n".join(new_lines) + "\n")
+        self._cache = _ParsedFile(content, tasks, ready, checkboxes)
+        return self._cache
 
     def claim_task(self, task_id: str) -> bool:  # noqa: ARG002
         return True
 
-    def _parse_tasks(self, content: str) -> list[Task]:
+    def _parse_tasks(
+        self, content: str, checkboxes: dict[str, list[int]] | None = None
+    ) -> list[Task]:
+        """Parse tasks from content.
+
+        If ``checkboxes`` is given, it is filled with task_id -> offsets of
+        that task's checkbox character in ``content``.
+        """
         tasks: list[Task] = []
         current_phase = ""
         # Track last sequential (non-parallel) task per story for dependency chaining
         last_sequential: dict[str, str] = {}
 
-        for line in content.splitlines():
-            # Check for phase headers
-            phase_match = _PHASE_HEADER.match(line)
-            if phase_match:
-                current_phase = phase_match.group(1).strip()
+        for match in _SPECKIT_ENTRY.finditer("\n" + content):
+            phase = match["phase"]
+            if phase is not None:
+                current_phase = phase.strip()
                 continue
 
-            # Check for task lines
-            task_match = _SPECKIT_LINE.match(line)
-            if not task_match:
-                continue
-
-            checkbox, task_id, rest = task_match.groups()
+            task_id = match["id"]
+            if checkboxes is not None:
+                checkboxes.setdefault(task_id, []).append(match.start("check") - 1)
             status = (
-                TaskStatus.completed if checkbox in ("x", "X") else TaskStatus.pending
+                TaskStatus.completed
+                if match["check"] in ("x", "X")
+                else TaskStatus.pending
             )
-
-            # Parse parallel marker
-            is_parallel = False
-            parallel_match = _PARALLEL_MARKER.match(rest)
-            if parallel_match:
-                is_parallel = True
-                rest = parallel_match.group(1)
-
-            # Parse story label
-            story = ""
-            story_match = _STORY_LABEL.match(rest)
-            if story_match:
-                story = f"US{story_match.group(1)}"
-                rest = story_match.group(2)
-
-            description = rest.strip()
+            is_parallel = match["par"] is not None
+            story = f"US{match['story']}" if match["story"] else ""
+            description = match["desc"].strip()
 
             # Build labels
             labels: dict[str, str] = {}
@@ -1,6 +1,5 @@
 """RealStepHandler: dispatches workflow steps to backend operations."""
 
-import hashlib
 import os
 import re
 import subprocess
@@ -14,7 +13,7 @@ from superintendent.backends.terminal import build_agent_command, wrap_with_life
 from superintendent.orchestrator.executor import StepResult
 from superintendent.orchestrator.models import Verbosity, WorkflowStep
 from superintendent.state.ralph import RalphState
-from superintendent.state.token_store import TokenStore
+from superintendent.state.token_store import DEFAULT_KEY, TokenStore
 
 SANDBOX_BASE_IMAGE = "docker/sandbox-templates:claude-code"
 
@@ -38,6 +37,8 @@ class ExecutionContext:
 class RealStepHandler:
     """Dispatches workflow steps to real backend operations."""
 
+    __slots__ = ("_context", "_dispatch")
+
     def __init__(self, context: ExecutionContext) -> None:
         self._context = context
         self._dispatch: dict[str, Callable[[WorkflowStep], StepResult]] = {
@@ -183,13 +184,13 @@ class RealStepHandler:
             # --force: remove existing worktree and recreate from scratch
             git.remove_worktree(repo_path, worktree_path)
             ok = git.create_worktree(repo_path, branch, worktree_path)
-        elif worktree_path.exists() and git.branch_exists(repo_path, branch):
-            # Scenario 1: worktree + branch already exist — reuse
-            ok = True
-            reused = True
         elif git.branch_exists(repo_path, branch):
-            # Scenario 2: branch exists but no worktree — attach
-            ok = git.create_worktree_from_existing(repo_path, branch, worktree_path)
+            if worktree_path.exists():
+                # Scenario 1: worktree + branch already exist — reuse
+                ok = True
+            else:
+                # Scenario 2: branch exists but no worktree — attach
+                ok = git.create_worktree_from_existing(repo_path, branch, worktree_path)
             reused = True
         else:
             # Scenario 3: neither exists — create new branch + worktree
@@ -229,13 +230,11 @@ class RealStepHandler:
             return None
 
         age_str = f"{age:.0f}"
-        if not git.fetch(worktree_path):
+        outcome, default_branch = git.fetch_and_merge_default(worktree_path)
+        if outcome == "fetch_failed":
             return f"Branch '{branch}' is {age_str} days stale, but fetch failed"
 
-        default_branch = git.get_default_branch(worktree_path)
-        remote_ref = f"origin/{default_branch}"
-
-        if git.merge_branch(worktree_path, remote_ref):
+        if outcome == "merged":
             return (
                 f"Branch '{branch}' was {age_str} days stale; "
                 f"merged {default_branch} successfully"
@@ -248,6 +247,8 @@ class RealStepHandler:
     # -- Template handler (prepare_template) ----------------------------------
 
     def _handle_prepare_template(self, step: WorkflowStep) -> StepResult:
+        import hashlib
+
         dockerfile = (
             "FROM dolthub/dolt:latest AS dolt-binary\n"
             f"FROM {SANDBOX_BASE_IMAGE}\n"
@@ -384,7 +385,7 @@ class RealStepHandler:
                     return result.token
 
         # Try default token
-        default = store.get("_default")
+        default = store.get(DEFAULT_KEY)
         if default:
             return default.token
 
@@ -15,7 +15,7 @@ class GroupStrategy(StrEnum):
     SINGLE = "single"
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskInfo:
     """Lightweight task descriptor for strategy decisions.
 
@@ -30,7 +30,7 @@ class TaskInfo:
     labels: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionDecision:
     """Strategy output: chosen mode, target, parallelism, and task grouping."""
 
@@ -125,13 +125,19 @@ class ExecutionStrategy:
         reasons: list[str],
     ) -> Mode:
         """Decide between interactive and autonomous mode."""
-        # Any destructive task forces interactive
-        if any(t.is_destructive for t in tasks):
-            reasons.append("Destructive operations detected, using interactive mode")
-            return Mode.interactive
+        # One pass: any destructive task forces interactive, otherwise
+        # accumulate the total complexity
+        weight = _COMPLEXITY_WEIGHTS.get
+        total_complexity = 0
+        for t in tasks:
+            if t.is_destructive:
+                reasons.append(
+                    "Destructive operations detected, using interactive mode"
+                )
+                return Mode.interactive
+            total_complexity += weight(t.complexity, 1)
 
         # High total complexity suggests interactive
-        total_complexity = sum(_COMPLEXITY_WEIGHTS.get(t.complexity, 1) for t in tasks)
         if total_complexity >= _INTERACTIVE_COMPLEXITY_THRESHOLD:
             reasons.append(
                 f"High total complexity ({total_complexity}), using interactive mode"
@@ -179,34 +185,49 @@ class ExecutionStrategy:
         if not tasks:
             return []
 
-        task_by_name: dict[str, TaskInfo] = {t.name: t for t in tasks}
-
-        # Build adjacency: union-find to group connected tasks
-        parent: dict[str, str] = {t.name: t.name for t in tasks}
+        # Common case: no dependencies, so only tasks sharing a name are
+        # grouped and the union-find below is unnecessary
+        if not any(t.depends_on for t in tasks):
+            by_name: dict[str, list[TaskInfo]] = {}
+            for task in tasks:
+                by_name.setdefault(task.name, []).append(task)
+            return list(by_name.values())
+
+        # Union-find over integer node ids, one per distinct task name,
+        # with union by rank and path halving
+        index: dict[str, int] = {}
+        for task in tasks:
+            index.setdefault(task.name, len(index))
+        nodes = [index[t.name] for t in tasks]
+        parent = list(range(len(index)))
+        rank = [0] * len(index)
 
-        def find(x: str) -> str:
+        def find(x: int) -> int:
             while parent[x] != x:
                 parent[x] = parent[parent[x]]
                 x = parent[x]
             return x
 
-        def union(a: str, b: str) -> None:
+        def union(a: int, b: int) -> None:
             ra, rb = find(a), find(b)
-            if ra != rb:
-                parent[ra] = rb
+            if ra == rb:
+                return
+            if rank[ra] < rank[rb]:
+                ra, rb = rb, ra
+            parent[rb] = ra
+            if rank[ra] == rank[rb]:
+                rank[ra] += 1
 
         # Union tasks that have dependency relationships
-        for task in tasks:
+        for task, node in zip(tasks, nodes, strict=True):
             for dep_name in task.depends_on:
-                if dep_name in task_by_name:
-                    union(task.name, dep_name)
-
-        # Collect groups
-        groups: dict[str, list[TaskInfo]] = {}
-        for task in tasks:
-            root = find(task.name)
-            if root not in groups:
-                groups[root] = []
-            groups[root].append(task)
+                dep = index.get(dep_name)
+                if dep is not None:
+                    union(node, dep)
+
+        # Collect groups, ordered by each group's first task
+        groups: dict[int, list[TaskInfo]] = {}
+        for task, node in zip(tasks, nodes, strict=True):
+            groups.setdefault(find(node), []).append(task)
 
         return list(groups.values())
@@ -0,0 +1,40 @@
+"""Crash-safe file replacement for state files."""
+
+import os
+import secrets
+import stat
+from pathlib import Path
+
+
+def write_text_atomic(path: Path, text: str, mode: int = 0o666) -> None:
+    """Write text to path so readers see either the old or the new file.
+
+    The text goes to a temporary file in the same directory, which then
+    replaces path via os.replace(). Symlinks are followed, so the link
+    target is replaced rather than the link. An existing file keeps its
+    permission bits; a new one is created with mode filtered through the
+    umask, as open() would.
+    """
+    path = Path(os.path.realpath(path))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        existing_mode: int | None = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        existing_mode = None
+    while True:
+        tmp = path.with_name(f".{path.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            # os.open applies the umask to mode, unlike mkstemp's fixed 0600
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+            break
+        except FileExistsError:
+            continue
+    try:
+        if existing_mode is not None:
+            os.fchmod(fd, existing_mode)
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
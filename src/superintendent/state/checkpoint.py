@@ -6,7 +6,8 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-from superintendent.state.workflow import WorkflowState
+from superintendent.state.atomic import write_text_atomic
+from superintendent.state.workflow import STATE_BY_NAME, WorkflowState
 
 
 def _now() -> datetime:
@@ -52,7 +53,7 @@ class WorkflowCheckpoint:
     def from_dict(cls, data: dict[str, Any]) -> "WorkflowCheckpoint":
         return cls(
             workflow_id=data["workflow_id"],
-            current_state=WorkflowState[data["current_state"]],
+            current_state=STATE_BY_NAME[data["current_state"]],
             completed_steps=data["completed_steps"],
             sandbox_name=data["sandbox_name"],
             worktree_path=data["worktree_path"],
@@ -62,16 +63,21 @@ class WorkflowCheckpoint:
 
 
 def save_checkpoint(checkpoint: WorkflowCheckpoint, path: Path) -> None:
-    """Save a checkpoint to a JSON file, creating parent directories as needed."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(checkpoint.to_dict(), indent=2))
+    """Save a checkpoint to a JSON file, creating parent directories as needed.
+
+    The file is replaced atomically, so a crash mid-save leaves the previous
+    checkpoint intact. Output is compact: indent= forces json onto its
+    pure-Python encoder.
+    """
+    write_text_atomic(path, json.dumps(checkpoint.to_dict()))
 
 
 def load_checkpoint(path: Path) -> WorkflowCheckpoint | None:
     """Load a checkpoint from a JSON file. Returns None if file doesn't exist."""
-    if not path.exists():
+    try:
+        data = json.loads(path.read_bytes())
+    except FileNotFoundError:
         return None
-    data = json.loads(path.read_text())
     return WorkflowCheckpoint.from_dict(data)
 
 
@@ -24,10 +24,12 @@ class RalphState:
     @property
     def config(self) -> dict[str, Any] | None:
         """Load config from config.json. Returns None if not initialized."""
-        config_path = self.ralph_dir / "config.json"
-        if not config_path.exists():
+        try:
+            result: dict[str, Any] = json.loads(
+                (self.ralph_dir / "config.json").read_bytes()
+            )
+        except FileNotFoundError:
             return None
-        result: dict[str, Any] = json.loads(config_path.read_text())
         return result
 
     def init(
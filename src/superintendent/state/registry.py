@@ -1,17 +1,54 @@
 """Global registry for tracking active entries."""
 
 import json
+import os
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from superintendent.state.atomic import write_text_atomic
+
 
 def _now_iso() -> str:
     return datetime.now(UTC).isoformat()
 
 
-@dataclass
+def existing_worktree_paths(paths: Iterable[str]) -> set[str]:
+    """Return the subset of paths that exist.
+
+    Paths sharing a parent directory are resolved with one scandir() of
+    that parent instead of a stat() each. Anything scandir() can't vouch
+    for (symlinks, unreadable parents, case-folding filesystems) falls
+    back to Path.exists().
+    """
+    by_parent: dict[Path, list[tuple[str, str]]] = {}
+    for raw in paths:
+        path = Path(raw)
+        by_parent.setdefault(path.parent, []).append((raw, path.name))
+
+    existing: set[str] = set()
+    for parent, children in by_parent.items():
+        if len(children) == 1:
+            raw = children[0][0]
+            if Path(raw).exists():
+                existing.add(raw)
+            continue
+        try:
+            with os.scandir(parent) as it:
+                present = {e.name for e in it if not e.is_symlink()}
+        except FileNotFoundError:
+            continue
+        except OSError:
+            present = set()
+        for raw, name in children:
+            if name in present or Path(raw).exists():
+                existing.add(raw)
+    return existing
+
+
+@dataclass(slots=True)
 class WorktreeEntry:
     """A single entry in the global registry."""
 
@@ -45,7 +82,9 @@ class WorktreeEntry:
             branch=data["branch"],
             worktree_path=data["worktree_path"],
             sandbox_name=data.get("sandbox_name"),
-            created_at=data.get("created_at", _now_iso()),
+            # Only stamp legacy entries; a .get() default would be evaluated
+            # (and a datetime formatted) for every entry
+            created_at=data["created_at"] if "created_at" in data else _now_iso(),
             github_url=data.get("github_url"),
             merged_pr=data.get("merged_pr", False),
         )
@@ -56,17 +95,40 @@ class WorktreeRegistry:
 
     def __init__(self, path: Path) -> None:
         self._path = path
+        # (st_mtime_ns, st_size, raw entry dicts) from the last read or write.
+        # Entries are rebuilt from the dicts on each call, so callers never
+        # share mutable WorktreeEntry objects with the cache.
+        self._cache: tuple[int, int, list[dict[str, Any]]] | None = None
 
     def _load(self) -> list["WorktreeEntry"]:
-        if not self._path.exists():
-            return []
-        data = json.loads(self._path.read_text())
-        return [WorktreeEntry.from_dict(w) for w in data.get("entries", [])]
+        return list(self.iter_entries())
 
     def _save(self, entries: list["WorktreeEntry"]) -> None:
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        data = {"entries": [e.to_dict() for e in entries]}
-        self._path.write_text(json.dumps(data, indent=2))
+        raw = [e.to_dict() for e in entries]
+        write_text_atomic(self._path, json.dumps({"entries": raw}, indent=2))
+        stat = self._path.stat()
+        self._cache = (stat.st_mtime_ns, stat.st_size, raw)
+
+    def _raw_entries(self) -> list[dict[str, Any]]:
+        """Return the raw entry dicts, re-reading only if the file changed."""
+        try:
+            stat = self._path.stat()
+        except FileNotFoundError:
+            self._cache = None
+            return []
+        if self._cache is not None and self._cache[:2] == (
+            stat.st_mtime_ns,
+            stat.st_size,
+        ):
+            return self._cache[2]
+        raw = json.loads(self._path.read_bytes()).get("entries", [])
+        self._cache = (stat.st_mtime_ns, stat.st_size, raw)
+        return raw
+
+    def iter_entries(self) -> Iterator["WorktreeEntry"]:
+        """Yield registered entries, building each one only when reached."""
+        for raw in self._raw_entries():
+            yield WorktreeEntry.from_dict(raw)
 
     def list_all(self) -> list["WorktreeEntry"]:
         """Return all registered entries."""
@@ -74,14 +136,14 @@ class WorktreeRegistry:
 
     def get(self, name: str) -> WorktreeEntry | None:
         """Look up an entry by name."""
-        for entry in self._load():
+        for entry in self.iter_entries():
             if entry.name == name:
                 return entry
         return None
 
     def get_by_branch(self, branch: str) -> WorktreeEntry | None:
         """Look up an entry by branch name."""
-        for entry in self._load():
+        for entry in self.iter_entries():
             if entry.branch == branch:
                 return entry
         return None
@@ -101,13 +163,24 @@ class WorktreeRegistry:
         self._save(filtered)
         return True
 
+    def remove_many(self, names: Iterable[str]) -> list[str]:
+        """Remove several entries in one save. Returns the names removed."""
+        targets = set(names)
+        entries = self._load()
+        keep = [e for e in entries if e.name not in targets]
+        removed = [e.name for e in entries if e.name in targets]
+        if removed:
+            self._save(keep)
+        return removed
+
     def cleanup(self) -> list[str]:
         """Remove entries whose worktree_path no longer exists. Returns removed names."""
         entries = self._load()
+        existing = existing_worktree_paths(e.worktree_path for e in entries)
         keep: list[WorktreeEntry] = []
         removed: list[str] = []
         for entry in entries:
-            if Path(entry.worktree_path).exists():
+            if entry.worktree_path in existing:
                 keep.append(entry)
             else:
                 removed.append(entry.name)
@@ -7,6 +7,8 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from superintendent.state.atomic import write_text_atomic
+
 DEFAULT_KEY = "_default"
 
 
@@ -15,7 +17,7 @@ def _default_token_path() -> Path:
     return Path.home() / ".claude" / "ralph-tokens.json"
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenEntry:
     """A stored GitHub token, optionally associated with a GitHub user.
 
@@ -49,7 +51,7 @@ class TokenEntry:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ResolveResult:
     """Result of resolving a token for a repository.
 
@@ -64,6 +66,11 @@ class ResolveResult:
     source: str
 
 
+# Shared results for the outcomes that carry no token
+_NO_DEFAULT = ResolveResult(token=None, source="none")
+_ORG_REQUIRES_EXPLICIT = ResolveResult(token=None, source="org_requires_explicit")
+
+
 class TokenStore:
     """Manages GitHub tokens stored in ~/.claude/ralph-tokens.json.
 
@@ -74,16 +81,15 @@ class TokenStore:
     def __init__(self, path: Path | None = None) -> None:
         self._path = path or _default_token_path()
 
-    def _load(self) -> dict[str, TokenEntry]:
-        if not self._path.exists():
+    def _load_raw(self) -> dict[str, dict[str, Any]]:
+        try:
+            return json.loads(self._path.read_bytes())
+        except FileNotFoundError:
             return {}
-        data = json.loads(self._path.read_text())
-        return {key: TokenEntry.from_dict(entry) for key, entry in data.items()}
 
-    def _save(self, entries: dict[str, TokenEntry]) -> None:
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        data = {key: entry.to_dict() for key, entry in entries.items()}
-        self._path.write_text(json.dumps(data, indent=2))
+    def _save(self, data: dict[str, dict[str, Any]]) -> None:
+        # Tokens are secrets: a newly created store is readable by the owner only
+        write_text_atomic(self._path, json.dumps(data, indent=2), mode=0o600)
 
     def add(
         self,
@@ -93,31 +99,35 @@ class TokenStore:
         github_user: str = "",
     ) -> None:
         """Add a token for a repository (or _default). Overwrites if exists."""
-        entries = self._load()
-        entries[repo] = TokenEntry(
+        # Untouched entries go back to disk as the dicts they were read as
+        data = self._load_raw()
+        data[repo] = TokenEntry(
             token=token,
             created_at=datetime.now(UTC).isoformat(),
             permissions=permissions or [],
             github_user=github_user,
-        )
-        self._save(entries)
+        ).to_dict()
+        self._save(data)
 
     def get(self, repo: str) -> TokenEntry | None:
         """Get a token entry by key (repo or _default)."""
-        return self._load().get(repo)
+        raw = self._load_raw().get(repo)
+        return TokenEntry.from_dict(raw) if raw is not None else None
 
     def remove(self, repo: str) -> bool:
         """Remove a token by key. Returns True if it existed."""
-        entries = self._load()
-        if repo not in entries:
+        data = self._load_raw()
+        if repo not in data:
             return False
-        del entries[repo]
-        self._save(entries)
+        del data[repo]
+        self._save(data)
         return True
 
     def list_all(self) -> dict[str, TokenEntry]:
         """Return all stored tokens, including _default."""
-        return self._load()
+        return {
+            key: TokenEntry.from_dict(entry) for key, entry in self._load_raw().items()
+        }
 
     def resolve(self, repo: str) -> "ResolveResult":
         """Resolve a token for a repository.
@@ -128,18 +138,20 @@ class TokenStore:
         3. Owner differs from default user (org repo) → source="org_requires_explicit"
         4. No default configured → source="none"
         """
-        entries = self._load()
+        # One read; only the entries consulted below are turned into objects
+        entries = self._load_raw()
 
         # 1. Exact per-repo match
-        entry = entries.get(repo)
-        if entry is not None:
-            return ResolveResult(token=entry.token, source="repo")
+        raw = entries.get(repo)
+        if raw is not None:
+            return ResolveResult(token=raw["token"], source="repo")
 
         # Check default token
-        default = entries.get(DEFAULT_KEY)
+        raw_default = entries.get(DEFAULT_KEY)
+        default = TokenEntry.from_dict(raw_default) if raw_default is not None else None
         if default is None:
             # 4. No default configured
-            return ResolveResult(token=None, source="none")
+            return _NO_DEFAULT
 
         # Extract owner from "owner/repo" format
         owner = repo.split("/")[0] if "/" in repo else repo
@@ -149,7 +161,7 @@ class TokenStore:
             return ResolveResult(token=default.token, source="default")
 
         # 3. Owner differs — org repo requires explicit token
-        return ResolveResult(token=None, source="org_requires_explicit")
+        return _ORG_REQUIRES_EXPLICIT
 
 
 def introspect_token_permissions(token: str) -> list[str]:
@@ -21,6 +21,11 @@ class WorkflowState(Enum):
     FAILED = auto()
 
 
+# Name -> member as a plain dict; WorkflowState[name] goes through the
+# enum metaclass's Python-level __getitem__
+STATE_BY_NAME: dict[str, WorkflowState] = {state.name: state for state in WorkflowState}
+
+
 # Valid transitions: state -> set of states it can move to.
 # FAILED is reachable from any non-terminal state.
 _TRANSITIONS: dict[WorkflowState, set[WorkflowState]] = {
@@ -68,6 +73,15 @@ _TRANSITIONS: dict[WorkflowState, set[WorkflowState]] = {
     WorkflowState.FAILED: set(),
 }
 
+# One bit per state; each state's allowed targets OR-ed into a single mask
+_STATE_BIT: dict[WorkflowState, int] = {
+    state: 1 << i for i, state in enumerate(WorkflowState)
+}
+_SUCCESSOR_MASK: dict[WorkflowState, int] = {
+    state: sum(_STATE_BIT[target] for target in targets)
+    for state, targets in _TRANSITIONS.items()
+}
+
 # The linear progression order (excluding terminal states)
 WORKFLOW_ORDER: list[WorkflowState] = [
     WorkflowState.INIT,
@@ -86,20 +100,22 @@ WORKFLOW_ORDER: list[WorkflowState] = [
 
 def valid_transition(current: WorkflowState, target: WorkflowState) -> bool:
     """Check if transitioning from current to target is allowed."""
-    return target in _TRANSITIONS.get(current, set())
+    return bool(_SUCCESSOR_MASK[current] & _STATE_BIT[target])
+
+
+# Successor of each state in WORKFLOW_ORDER; the last state maps to None
+_NEXT_STATE: dict[WorkflowState, WorkflowState | None] = dict(
+    zip(WORKFLOW_ORDER, [*WORKFLOW_ORDER[1:], None], strict=True)
+)
+
+_TERMINAL_STATES = frozenset({WorkflowState.COMPLETED, WorkflowState.FAILED})
 
 
 def next_state(current: WorkflowState) -> WorkflowState | None:
     """Return the next state in the linear progression, or None if terminal."""
-    try:
-        idx = WORKFLOW_ORDER.index(current)
-    except ValueError:
-        return None
-    if idx + 1 < len(WORKFLOW_ORDER):
-        return WORKFLOW_ORDER[idx + 1]
-    return None
+    return _NEXT_STATE.get(current)
 
 
 def is_terminal(state: WorkflowState) -> bool:
     """Return True if the state is a terminal state (COMPLETED or FAILED)."""
-    return state in (WorkflowState.COMPLETED, WorkflowState.FAILED)
+    return state in _TERMINAL_STATES
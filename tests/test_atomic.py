@@ -0,0 +1,81 @@
+"""Tests for atomic state file writes."""
+
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from superintendent.state.atomic import write_text_atomic
+
+
+class TestWriteTextAtomic:
+    def test_writes_content(self, tmp_path: Path):
+        path = tmp_path / "state.json"
+        write_text_atomic(path, '{"a": 1}')
+        assert path.read_text() == '{"a": 1}'
+
+    def test_creates_parent_dirs(self, tmp_path: Path):
+        path = tmp_path / "deep" / "nested" / "state.json"
+        write_text_atomic(path, "{}")
+        assert path.read_text() == "{}"
+
+    def test_replaces_existing_without_leftovers(self, tmp_path: Path):
+        path = tmp_path / "state.json"
+        path.write_text("old")
+        write_text_atomic(path, "new")
+        assert path.read_text() == "new"
+        assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
+
+    def test_failed_write_keeps_old_file(self, tmp_path: Path, monkeypatch):
+        path = tmp_path / "state.json"
+        path.write_text("old")
+
+        def fail_replace(*_args):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "replace", fail_replace)
+        with pytest.raises(OSError):
+            write_text_atomic(path, "new")
+        assert path.read_text() == "old"
+        assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
+
+    def test_preserves_existing_mode(self, tmp_path: Path):
+        path = tmp_path / "state.json"
+        path.write_text("old")
+        path.chmod(0o644)
+        write_text_atomic(path, "new")
+        assert stat.S_IMODE(path.stat().st_mode) == 0o644
+
+    def test_new_file_follows_umask(self, tmp_path: Path):
+        old = os.umask(0o022)
+        try:
+            write_text_atomic(tmp_path / "state.json", "{}")
+            write_text_atomic(tmp_path / "secret.json", "{}", mode=0o600)
+        finally:
+            os.umask(old)
+        assert stat.S_IMODE((tmp_path / "state.json").stat().st_mode) == 0o644
+        assert stat.S_IMODE((tmp_path / "secret.json").stat().st_mode) == 0o600
+
+    def test_symlinked_target_is_written_through(self, tmp_path: Path):
+        target = tmp_path / "dotfiles" / "tokens.json"
+        target.parent.mkdir()
+        target.write_text("old")
+        target.chmod(0o640)
+        link = tmp_path / "tokens.json"
+        link.symlink_to(target)
+
+        write_text_atomic(link, "new")
+
+        assert link.is_symlink()
+        assert target.read_text() == "new"
+        assert stat.S_IMODE(target.stat().st_mode) == 0o640
+        assert sorted(p.name for p in target.parent.iterdir()) == ["tokens.json"]
+
+    def test_dangling_symlink_creates_target(self, tmp_path: Path):
+        target = tmp_path / "real" / "state.json"
+        link = tmp_path / "state.json"
+        link.symlink_to(target)
+        write_text_atomic(link, "{}")
+        assert link.is_symlink()
+        assert target.read_text() == "{}"
@@ -1,6 +1,7 @@
 """Tests for BeadsSource adapter."""
 
 import json
+import subprocess
 from pathlib import Path
 from unittest.mock import patch
 
@@ -189,6 +190,30 @@ class TestBeadsSourceGetTasks:
         tasks = source.get_tasks()
         assert tasks == []
 
+    def test_parse_bead_tolerates_null_fields(self):
+        task = BeadsSource._parse_bead(
+            {
+                "id": "sup-9",
+                "title": "Sparse",
+                "description": None,
+                "dependencies": None,
+                "labels": ["phase:ui", "plain"],
+            }
+        )
+        assert task.status == TaskStatus.pending
+        assert task.description == ""
+        assert task.dependencies == []
+        assert task.labels == {"phase": "ui"}
+
+    @patch("superintendent.orchestrator.sources.beads.subprocess.run")
+    def test_reads_json_output_as_bytes(self, mock_run):
+        mock_run.return_value = _make_result(stdout=SAMPLE_BD_LIST_JSON.encode())
+        source = BeadsSource(repo_root=Path("/fake/repo"))
+        tasks = source.get_tasks()
+        assert len(tasks) == 3
+        assert "text" not in mock_run.call_args.kwargs
+        assert mock_run.call_args.kwargs["stdout"] == subprocess.PIPE
+
 
 class TestBeadsSourceGetReadyTasks:
     @patch("superintendent.orchestrator.sources.beads.subprocess.run")
@@ -217,6 +242,43 @@ class TestBeadsSourceGetReadyTasks:
         assert ready == []
 
 
+class TestBeadsSourceQueryCache:
+    @patch("superintendent.orchestrator.sources.beads.subprocess.run")
+    def test_repeat_query_within_ttl_reuses_result(self, mock_run):
+        mock_run.return_value = _make_result(stdout=SAMPLE_BD_READY_JSON)
+        source = BeadsSource(repo_root=Path("/fake/repo"))
+        first = source.get_ready_tasks()
+        second = source.get_ready_tasks()
+        assert mock_run.call_count == 1
+        assert first == second
+        assert first[0] is not second[0]
+
+    @patch("superintendent.orchestrator.sources.beads.subprocess.run")
+    def test_mutation_invalidates_cache(self, mock_run):
+        mock_run.return_value = _make_result(stdout=SAMPLE_BD_READY_JSON)
+        source = BeadsSource(repo_root=Path("/fake/repo"))
+        source.get_ready_tasks()
+        source.update_status("sup-1", TaskStatus.completed)
+        source.get_ready_tasks()
+        assert mock_run.call_count == 3
+
+    @patch("superintendent.orchestrator.sources.beads.subprocess.run")
+    def test_zero_ttl_disables_cache(self, mock_run):
+        mock_run.return_value = _make_result(stdout=SAMPLE_BD_READY_JSON)
+        source = BeadsSource(repo_root=Path("/fake/repo"), cache_ttl=0)
+        source.get_ready_tasks()
+        source.get_ready_tasks()
+        assert mock_run.call_count == 2
+
+    @patch("superintendent.orchestrator.sources.beads.subprocess.run")
+    def test_failures_are_not_cached(self, mock_run):
+        mock_run.return_value = _make_result(returncode=1)
+        source = BeadsSource(repo_root=Path("/fake/repo"))
+        assert source.get_ready_tasks() == []
+        mock_run.return_value = _make_result(stdout=SAMPLE_BD_READY_JSON)
+        assert len(source.get_ready_tasks()) == 2
+
+
 class TestBeadsSourceUpdateStatus:
     @patch("superintendent.orchestrator.sources.beads.subprocess.run")
     def test_completed_calls_bd_close(self, mock_run):
@@ -237,6 +299,40 @@ class TestBeadsSourceUpdateStatus:
         assert "sup-1" in cmd
 
 
+class TestBeadsSourceUpdateStatuses:
+    @patch("superintendent.orchestrator.sources.beads.subprocess.run")
+    def test_one_bd_call_per_status(self, mock_run):
+        mock_run.return_value = _make_result()
+        source = BeadsSource(repo_root=Path("/fake/repo"))
+        source.update_statuses(
+            [
+                ("sup-1", TaskStatus.completed),
+                ("sup-2", TaskStatus.failed),
+                ("sup-3", TaskStatus.completed),
+            ]
+        )
+        cmds = [call[0][0] for call in mock_run.call_args_list]
+        assert cmds == [
+            ["bd", "close", "sup-1", "sup-3", "--message", "Completed by agent"],
+            ["bd", "update", "sup-2", "--set", "status=failed"],
+        ]
+
+    @patch("superintendent.orchestrator.sources.beads.subprocess.run")
+    def test_status_writes_discard_output(self, mock_run):
+        mock_run.return_value = _make_result()
+        source = BeadsSource(repo_root=Path("/fake/repo"))
+        source.update_statuses([("sup-1", TaskStatus.completed)])
+        kwargs = mock_run.call_args.kwargs
+        assert kwargs["stdout"] == subprocess.DEVNULL
+        assert kwargs["stderr"] == subprocess.DEVNULL
+
+    @patch("superintendent.orchestrator.sources.beads.subprocess.run")
+    def test_no_updates_runs_nothing(self, mock_run):
+        source = BeadsSource(repo_root=Path("/fake/repo"))
+        source.update_statuses([("sup-1", TaskStatus.pending)])
+        mock_run.assert_not_called()
+
+
 class TestBeadsSourceClaim:
     @patch("superintendent.orchestrator.sources.beads.subprocess.run")
     def test_claim_calls_bd_update_claim(self, mock_run):
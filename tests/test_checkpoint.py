@@ -231,3 +231,18 @@ class TestSaveLoadCheckpoint:
         assert loaded is not None
         assert loaded.current_state == WorkflowState.CREATING_WORKTREE
         assert loaded.completed_steps == ["validate_repo"]
+        assert [p.name for p in tmp_path.iterdir()] == ["workflow_state.json"]
+
+    def test_save_writes_compact_json(self, tmp_path: Path):
+        cp = WorkflowCheckpoint(
+            workflow_id="wf-compact",
+            current_state=WorkflowState.INIT,
+            completed_steps=["validate_repo"],
+            sandbox_name="sb",
+            worktree_path="/tmp/wt",
+        )
+        path = tmp_path / "workflow_state.json"
+        save_checkpoint(cp, path)
+        text = path.read_text()
+        assert "\n" not in text
+        assert json.loads(text) == cp.to_dict()
@@ -10,7 +10,7 @@ from superintendent.cli.main import (
     app,
     cleanup_all,
     cleanup_by_name,
-    list_entries,
+    get_default_registry,
 )
 from superintendent.state.registry import WorktreeEntry, WorktreeRegistry
 from superintendent.state.token_store import DEFAULT_KEY, TokenStore
@@ -482,11 +482,11 @@ class TestCleanupCommand:
 class TestBusinessLogicFunctions:
     """Test business logic functions independently."""
 
-    def test_list_entries_empty(self, tmp_path: Path) -> None:
+    def test_iter_entries_empty(self, tmp_path: Path) -> None:
         registry = WorktreeRegistry(tmp_path / "registry.json")
-        assert list_entries(registry) == []
+        assert list(registry.iter_entries()) == []
 
-    def test_list_entries_populated(self, tmp_path: Path) -> None:
+    def test_iter_entries_populated(self, tmp_path: Path) -> None:
         registry = WorktreeRegistry(tmp_path / "registry.json")
         registry.add(
             WorktreeEntry(
@@ -496,7 +496,7 @@ class TestBusinessLogicFunctions:
                 worktree_path="/tmp/wt",
             )
         )
-        entries = list_entries(registry)
+        entries = list(registry.iter_entries())
         assert len(entries) == 1
         assert entries[0].name == "test"
 
@@ -703,3 +703,10 @@ class TestTokenStatusWithDefault:
             assert result.exit_code == 0
             assert "Default:" in result.output
             assert "No tokens stored" not in result.output
+
+
+def test_default_registry_follows_home(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("HOME", str(tmp_path))
+    registry = get_default_registry()
+    registry.add(WorktreeEntry(name="a", repo="r", branch="b", worktree_path="/wt"))
+    assert (tmp_path / ".claude" / "superintendent-registry.json").exists()
@@ -1,5 +1,6 @@
 """Tests for TaskSource auto-detection logic."""
 
+import os
 from pathlib import Path
 
 from superintendent.orchestrator.sources.beads import BeadsSource
@@ -101,3 +102,29 @@ class TestDetectSourceAuto:
     def test_auto_returns_none_when_nothing_found(self, tmp_path: Path):
         source = detect_source(repo_root=tmp_path, source_type="auto")
         assert source is None
+
+    def test_auto_scans_repo_root_once(self, tmp_path: Path, monkeypatch):
+        (tmp_path / "TODO.md").write_text("- [ ] Task one\n")
+        calls: list[str] = []
+        real_scandir = os.scandir
+
+        def counting_scandir(path):
+            calls.append(str(path))
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+        source = detect_source(repo_root=tmp_path, source_type="auto")
+        assert isinstance(source, MarkdownSource)
+        assert calls == [str(tmp_path)]
+
+    def test_auto_ignores_directory_named_tasks_md(self, tmp_path: Path):
+        (tmp_path / "tasks.md").mkdir()
+        source = detect_source(repo_root=tmp_path, source_type="auto")
+        assert source is None
+
+    def test_auto_skips_tasks_md_directory_for_todo_md(self, tmp_path: Path):
+        (tmp_path / "tasks.md").mkdir()
+        (tmp_path / "TODO.md").write_text("- [ ] Task one\n")
+        source = detect_source(repo_root=tmp_path, source_type="auto")
+        assert isinstance(source, MarkdownSource)
+        assert [t.title for t in source.get_tasks()] == ["Task one"]
@@ -1,5 +1,7 @@
 """Tests for the Executor."""
 
+from datetime import datetime
+
 from superintendent.orchestrator.executor import (
     Executor,
     InvalidTransitionError,
@@ -227,6 +229,28 @@ class TestExecutor:
         assert executor.checkpoints[0]["success"] is True
         assert "timestamp" in executor.checkpoints[0]
 
+    def test_checkpoints_snapshot_completed_steps(self):
+        handler = MockHandler()
+        executor = Executor(handler=handler)
+        executor.run(self._sandbox_plan())
+
+        checkpoints = executor.checkpoints
+        assert checkpoints[0]["completed_steps"] == []
+        assert checkpoints[1]["completed_steps"] == ["validate_repo"]
+        assert len(checkpoints[-1]["completed_steps"]) == 7
+        assert datetime.fromisoformat(checkpoints[0]["timestamp"]).tzinfo is not None
+
+    def test_editing_result_does_not_rewrite_checkpoints(self):
+        handler = MockHandler()
+        executor = Executor(handler=handler)
+        result = executor.run(self._sandbox_plan())
+
+        result.completed_steps.clear()
+        result.completed_steps.append("tampered")
+        checkpoints = executor.checkpoints
+        assert checkpoints[1]["completed_steps"] == ["validate_repo"]
+        assert len(checkpoints[-1]["completed_steps"]) == 7
+
     def test_state_property_tracks_current(self):
         handler = MockHandler()
         executor = Executor(handler=handler)
@@ -192,6 +192,23 @@ class TestMockGitBackend:
         backend = MockGitBackend()
         assert backend.get_default_branch(Path("/repo")) == "main"
 
+    def test_fetch_and_merge_default(self):
+        backend = MockGitBackend(default_branch="master")
+        result = backend.fetch_and_merge_default(Path("/repo"))
+        assert result == ("merged", "master")
+        assert backend.fetched == [Path("/repo")]
+        assert backend.merges == [(Path("/repo"), "origin/master")]
+
+    def test_fetch_and_merge_default_fetch_failure(self):
+        backend = MockGitBackend(fail_on="fetch")
+        assert backend.fetch_and_merge_default(Path("/repo"))[0] == "fetch_failed"
+        assert backend.merges == []
+
+    def test_fetch_and_merge_default_conflict(self):
+        backend = MockGitBackend(fail_on="merge_branch")
+        assert backend.fetch_and_merge_default(Path("/repo")) == ("conflict", "main")
+        assert backend.merges == []
+
     def test_clone_for_sandbox_records_call(self):
         backend = MockGitBackend()
         result = backend.clone_for_sandbox(Path("/repo"), Path("/target"), "agent/test")
@@ -310,6 +327,14 @@ class TestDryRunGitBackend:
         assert result == "main"
         assert "symbolic-ref" in backend.commands[0]
 
+    def test_fetch_and_merge_default_records_single_command(self):
+        backend = DryRunGitBackend()
+        result = backend.fetch_and_merge_default(Path("/repo"))
+        assert result == ("merged", "main")
+        assert len(backend.commands) == 1
+        assert "fetch --all &&" in backend.commands[0]
+        assert "merge origin/" in backend.commands[0]
+
     def test_clone_for_sandbox_records_commands(self):
         backend = DryRunGitBackend()
         result = backend.clone_for_sandbox(Path("/repo"), Path("/target"), "agent/test")
@@ -830,6 +855,117 @@ class TestRealGitBackend:
         assert result is True
         assert wt_path.exists()
 
+    def test_ensure_local_memoizes_url_lookup(self, tmp_path, monkeypatch):
+        """A resolved URL clone is reused without searching again."""
+        repo_dir = tmp_path / "my-repo"
+        repo_dir.mkdir()
+        (repo_dir / ".git").mkdir()
+        calls = []
+        real_find = _find_local_clone
+
+        def counting_find(name, paths):
+            calls.append(name)
+            return real_find(name, paths)
+
+        monkeypatch.setattr(
+            "superintendent.backends.git._find_local_clone", counting_find
+        )
+        backend = RealGitBackend(search_paths=[tmp_path])
+        url = "https://github.com/user/my-repo"
+        assert backend.ensure_local(url) == repo_dir
+        assert backend.ensure_local(url) == repo_dir
+        assert calls == ["my-repo"]
+
+    @pytest.mark.integration
+    def test_branch_exists_memoized_until_refs_change(self, tmp_path, monkeypatch):
+        """branch_exists skips git while the branch's refs are unchanged."""
+        import subprocess
+
+        repo_path = tmp_path / "repo"
+        subprocess.run(["git", "init", str(repo_path)], check=True, capture_output=True)
+        subprocess.run(
+            [
+                "git",
+                "-C",
+                str(repo_path),
+                "-c",
+                "user.email=test@test.com",
+                "-c",
+                "user.name=Test",
+                "commit",
+                "--allow-empty",
+                "-m",
+                "init",
+            ],
+            check=True,
+            capture_output=True,
+        )
+
+        backend = RealGitBackend()
+        assert backend.branch_exists(repo_path, "agent/x") is False
+
+        real_run = subprocess.run
+        calls = []
+
+        def counting_run(*args, **kwargs):
+            calls.append(args[0])
+            return real_run(*args, **kwargs)
+
+        monkeypatch.setattr("superintendent.backends.git.subprocess.run", counting_run)
+        assert backend.branch_exists(repo_path, "agent/x") is False
+        assert calls == []
+
+        real_run(
+            ["git", "-C", str(repo_path), "branch", "agent/x"],
+            check=True,
+            capture_output=True,
+        )
+        assert backend.branch_exists(repo_path, "agent/x") is True
+        assert len(calls) == 1
+
+    @pytest.mark.integration
+    def test_fetch_and_merge_default(self, tmp_path):
+        """Integration test: one shell call fetches and merges origin's default."""
+        import subprocess
+
+        def git(*args: str) -> None:
+            subprocess.run(["git", *args], check=True, capture_output=True)
+
+        origin = tmp_path / "origin.git"
+        git("init", "--bare", "-b", "main", str(origin))
+        seed = tmp_path / "seed"
+        git("clone", str(origin), str(seed))
+        git("-C", str(seed), "config", "user.email", "test@test.com")
+        git("-C", str(seed), "config", "user.name", "Test")
+        git("-C", str(seed), "commit", "--allow-empty", "-m", "init")
+        git("-C", str(seed), "push", "origin", "HEAD:main")
+
+        work = tmp_path / "work"
+        git("clone", str(origin), str(work))
+        git("-C", str(work), "config", "user.email", "test@test.com")
+        git("-C", str(work), "config", "user.name", "Test")
+        git("-C", str(work), "checkout", "-b", "feature")
+
+        git("-C", str(seed), "commit", "--allow-empty", "-m", "upstream")
+        git("-C", str(seed), "push", "origin", "HEAD:main")
+
+        backend = RealGitBackend()
+        assert backend.fetch_and_merge_default(work) == ("merged", "main")
+        log = subprocess.run(
+            ["git", "-C", str(work), "log", "--format=%s"],
+            capture_output=True,
+            text=True,
+        )
+        assert "upstream" in log.stdout
+
+    @pytest.mark.integration
+    def test_fetch_and_merge_default_fetch_failure(self, tmp_path):
+        """Integration test: a missing origin reports fetch_failed."""
+        backend = RealGitBackend()
+        assert backend.fetch_and_merge_default(tmp_path / "missing")[0] == (
+            "fetch_failed"
+        )
+
 
 class TestHelperFunctions:
     """Test helper functions used by RealGitBackend."""
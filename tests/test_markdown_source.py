@@ -1,5 +1,7 @@
 """Tests for MarkdownSource adapter."""
 
+import hashlib
+import os
 from pathlib import Path
 from textwrap import dedent
 
@@ -76,6 +78,10 @@ class TestMarkdownSourceParsing:
         for task_id in ids:
             assert task_id.startswith("md-")
 
+    def test_generated_ids_are_stable(self):
+        digest = hashlib.sha256(b"Fix the login bug").hexdigest()[:8]
+        assert MarkdownSource._make_id("  Fix the login bug ") == f"md-{digest}"
+
     def test_explicit_ids_parsed(self, tmp_path: Path):
         md_file = tmp_path / "tasks.md"
         md_file.write_text(TASKS_WITH_IDS)
@@ -172,6 +178,104 @@ class TestMarkdownSourceStatusUpdate:
         source.update_status("NONEXISTENT", TaskStatus.completed)
         assert md_file.read_text() == original
 
+    def test_update_leaves_other_text_untouched(self, tmp_path: Path):
+        md_file = tmp_path / "tasks.md"
+        md_file.write_text("Intro\n\n- [ ] [T001] Fix it\n  trailing  ")
+        source = MarkdownSource(md_file)
+        source.update_status("T001", TaskStatus.completed)
+        assert md_file.read_text() == "Intro\n\n- [x] [T001] Fix it\n  trailing  "
+
+
+class TestMarkdownSourceCache:
+    def test_unchanged_file_is_parsed_once(self, tmp_path: Path, monkeypatch):
+        md_file = tmp_path / "tasks.md"
+        md_file.write_text(TASKS_WITH_IDS)
+        source = MarkdownSource(md_file)
+        calls = []
+        parse = MarkdownSource._parse_tasks
+        monkeypatch.setattr(
+            MarkdownSource,
+            "_parse_tasks",
+            lambda *args: calls.append(1) or parse(*args),
+        )
+        source.get_tasks()
+        source.get_ready_tasks()
+        assert len(calls) == 1
+
+    def test_external_edit_invalidates(self, tmp_path: Path):
+        md_file = tmp_path / "tasks.md"
+        md_file.write_text(TASKS_WITH_IDS)
+        source = MarkdownSource(md_file)
+        assert len(source.get_tasks()) == 3
+        md_file.write_text(TASKS_WITH_IDS + "- [ ] [T004] Write docs\n")
+        assert len(source.get_tasks()) == 4
+
+    def test_update_status_invalidates(self, tmp_path: Path):
+        md_file = tmp_path / "tasks.md"
+        md_file.write_text(TASKS_WITH_IDS)
+        source = MarkdownSource(md_file)
+        source.get_tasks()
+        source.update_status("T001", TaskStatus.completed)
+        statuses = {t.task_id: t.status for t in source.get_tasks()}
+        assert statuses["T001"] == TaskStatus.completed
+
+    def test_ready_tasks_refresh_after_update(self, tmp_path: Path):
+        md_file = tmp_path / "tasks.md"
+        md_file.write_text(NESTED_TASKS)
+        source = MarkdownSource(md_file)
+        assert [t.task_id for t in source.get_ready_tasks()] == ["T001", "T004"]
+        source.get_ready_tasks().clear()
+        assert len(source.get_ready_tasks()) == 2
+        source.update_status("T001", TaskStatus.completed)
+        assert [t.task_id for t in source.get_ready_tasks()] == [
+            "T002",
+            "T003",
+            "T004",
+        ]
+
+    def test_update_status_reuses_parse(self, tmp_path: Path, monkeypatch):
+        md_file = tmp_path / "tasks.md"
+        md_file.write_text(TASKS_WITH_IDS)
+        source = MarkdownSource(md_file)
+        source.get_tasks()
+        calls = []
+        parse = MarkdownSource._parse_tasks
+        monkeypatch.setattr(
+            MarkdownSource,
+            "_parse_tasks",
+            lambda *args: calls.append(1) or parse(*args),
+        )
+        source.update_status("T001", TaskStatus.completed)
+        assert calls == []
+        assert "- [x] [T001]" in md_file.read_text()
+
+    def test_mutating_returned_tasks_does_not_touch_cache(self, tmp_path: Path):
+        md_file = tmp_path / "tasks.md"
+        md_file.write_text(TASKS_WITH_IDS)
+        source = MarkdownSource(md_file)
+        for task in source.get_tasks() + source.get_ready_tasks():
+            task.status = TaskStatus.failed
+            task.dependencies.append("bogus")
+            task.labels["x"] = "y"
+        fresh = source.get_tasks()
+        assert TaskStatus.failed not in {t.status for t in fresh}
+        assert all("bogus" not in t.dependencies for t in fresh)
+        assert all("x" not in t.labels for t in source.get_ready_tasks())
+
+    def test_same_size_edit_in_same_mtime_tick(self, tmp_path: Path):
+        md_file = tmp_path / "tasks.md"
+        md_file.write_text(TASKS_WITH_IDS)
+        source = MarkdownSource(md_file)
+        assert source.get_tasks()[0].status == TaskStatus.pending
+        before = md_file.stat()
+        edited = TASKS_WITH_IDS.replace("- [ ] [T001]", "- [x] [T001]", 1)
+        assert len(edited) == len(TASKS_WITH_IDS)
+        md_file.write_text(edited)
+        os.utime(md_file, ns=(before.st_atime_ns, before.st_mtime_ns))
+        assert md_file.stat().st_size == before.st_size
+        assert source.get_tasks()[0].status == TaskStatus.completed
+        assert "T001" not in [t.task_id for t in source.get_ready_tasks()]
+
 
 class TestMarkdownSourceClaim:
     def test_claim_returns_true(self, tmp_path: Path):
@@ -4,7 +4,11 @@ import json
 
 import pytest
 
-from superintendent.orchestrator.models import WorkflowPlan, WorkflowStep
+from superintendent.orchestrator.models import (
+    WorkflowPlan,
+    WorkflowStep,
+    _topological_ids,
+)
 
 
 class TestWorkflowStep:
@@ -118,6 +122,12 @@ class TestWorkflowPlan:
         errors = plan.validate()
         assert any("cycle" in e.lower() for e in errors)
 
+    def test_validate_sees_mutations_after_cached_result(self):
+        plan = self._make_linear_plan()
+        assert plan.validate() == []
+        plan.steps[0].depends_on.append("missing")
+        assert any("unknown step 'missing'" in e for e in plan.validate())
+
     def test_validate_self_cycle(self):
         plan = WorkflowPlan(
             steps=[
@@ -160,6 +170,16 @@ class TestWorkflowPlan:
         assert ids.index("s2") < ids.index("s4")
         assert ids.index("s3") < ids.index("s4")
 
+    def test_execution_order_cached_per_shape(self):
+        _topological_ids.cache_clear()
+        first = self._make_linear_plan()
+        second = self._make_linear_plan()
+        first.execution_order()
+        order = second.execution_order()
+        assert _topological_ids.cache_info().hits == 1
+        # Cached IDs resolve to the second plan's own step objects
+        assert all(step is second.get_step(step.id) for step in order)
+
     def test_execution_order_no_deps(self):
         plan = WorkflowPlan(
             steps=[
@@ -191,6 +211,13 @@ class TestWorkflowPlan:
         assert len(data["steps"]) == 3
         assert data["metadata"]["repo"] == "test-repo"
 
+    def test_to_json_compact(self):
+        plan = self._make_linear_plan()
+        json_str = plan.to_json(indent=None)
+        assert "\n" not in json_str
+        assert ", " not in json_str
+        assert json.loads(json_str) == plan.to_dict()
+
     def test_from_json(self):
         json_str = json.dumps(
             {
@@ -1,6 +1,8 @@
 """Tests for the Orchestrator: multi-agent spawn, monitor, and completion."""
 
 import asyncio
+import threading
+import time
 from pathlib import Path
 
 from superintendent.backends.auth import MockAuthBackend
@@ -17,6 +19,7 @@ from superintendent.orchestrator.orchestrator import (
     Orchestrator,
     OrchestratorResult,
     _PendingGroup,
+    _PendingQueue,
 )
 from superintendent.orchestrator.reporter import MockReporter
 from superintendent.orchestrator.sources.models import Task, TaskStatus
@@ -192,6 +195,32 @@ class TestOrchestratorBasic:
         assert result.failed_tasks == []
         assert result.agents_spawned == 0
 
+    def test_spawns_share_handler_without_leaking_outputs(self, tmp_path: Path) -> None:
+        """Consecutive spawns reuse one handler but start from clean outputs."""
+        repo_path = tmp_path / "my-repo"
+        git = MockGitBackend(local_repos={str(repo_path): repo_path})
+        backends = _mock_backends(git=git)
+
+        orch = Orchestrator(
+            backends=backends,
+            poll_interval=0,
+            token_store=_mock_token_store(tmp_path),
+        )
+        decision = _decision([[TaskInfo(name="task-1")], [TaskInfo(name="task-2")]])
+        handler = orch._handler
+
+        first = orch._spawn_agent(
+            _PendingGroup(tasks=[TaskInfo(name="task-1")]), decision, str(repo_path)
+        )
+        second = orch._spawn_agent(
+            _PendingGroup(tasks=[TaskInfo(name="task-2")]), decision, str(repo_path)
+        )
+
+        assert first is not None and second is not None
+        assert orch._handler is handler
+        outputs = orch._context.step_outputs
+        assert outputs["prepare_sandbox"]["sandbox_name"] == second.sandbox_name
+
 
 class TestOrchestratorParallelism:
     """Tests that parallelism limits are respected."""
@@ -264,6 +293,35 @@ class TestOrchestratorParallelism:
         started_events = [e for e in reporter.events if e.event_type == "started"]
         assert len(started_events) == 2
 
+    def test_finished_agent_handled_before_slow_one(self, tmp_path: Path) -> None:
+        """An agent that finishes first is processed without waiting on others."""
+        repo_path = tmp_path / "my-repo"
+        git = MockGitBackend(local_repos={str(repo_path): repo_path})
+        slow_polls = {"n": 0}
+
+        class SlowFirstAgentDocker(MockDockerBackend):
+            def exec_in_sandbox(self, name: str, cmd: str) -> tuple[int, str]:
+                self.executed.append((name, cmd))
+                if cmd == _AGENT_STATUS_CMD and name == "ralph-agent-1":
+                    slow_polls["n"] += 1
+                    return (1, "") if slow_polls["n"] < 3 else (0, "0")
+                return (0, "")
+
+        backends = _mock_backends(git=git, docker=SlowFirstAgentDocker())
+        reporter = MockReporter()
+        decision = _decision([[TaskInfo(name="slow")], [TaskInfo(name="fast")]])
+
+        orch = Orchestrator(
+            backends=backends,
+            reporter=reporter,
+            max_parallel=2,
+            poll_interval=0,
+            token_store=_mock_token_store(tmp_path),
+        )
+        result = asyncio.run(orch.run(decision, repo=str(repo_path)))
+
+        assert result.completed_tasks == ["fast", "slow"]
+
 
 class TestOrchestratorFailureSkip:
     """Tests for FailurePolicy.SKIP (default)."""
@@ -538,6 +596,30 @@ class TestOrchestratorAgentStatus:
         status = orch._check_agent_status(handle, Target.sandbox)
         assert status == AgentStatus.COMPLETED
 
+    def test_watch_agent_waits_until_done(self) -> None:
+        """_watch_agent keeps polling while RUNNING and returns the final status."""
+        results = [(1, ""), (1, ""), (0, "0")]
+
+        class SequencedDockerBackend(MockDockerBackend):
+            def exec_in_sandbox(self, name: str, cmd: str) -> tuple[int, str]:
+                self.executed.append((name, cmd))
+                return results.pop(0)
+
+        docker = SequencedDockerBackend()
+        orch = Orchestrator(
+            backends=_mock_backends(docker=docker),
+            poll_interval=0,
+            token_store=_mock_token_store(),
+        )
+        handle = AgentHandle(
+            id="test-1", task_group=[TaskInfo(name="t")], sandbox_name="sb-1"
+        )
+
+        status = asyncio.run(orch._watch_agent(handle, Target.sandbox))
+
+        assert status == AgentStatus.COMPLETED
+        assert len(docker.executed) == 3
+
 
 class TestOrchestratorReporter:
     """Tests that reporter receives correct events."""
@@ -561,7 +643,7 @@ class TestOrchestratorReporter:
 
         started = [e for e in reporter.events if e.event_type == "started"]
         assert len(started) == 1
-        assert started[0].data["task_names"] == ["task-1"]
+        assert started[0].data["task_names"] == ("task-1",)
         assert started[0].data["sandbox_name"] is not None
 
     def test_reporter_receives_completed_event(self, tmp_path: Path) -> None:
@@ -583,7 +665,27 @@ class TestOrchestratorReporter:
 
         completed = [e for e in reporter.events if e.event_type == "completed"]
         assert len(completed) == 1
-        assert completed[0].data["task_names"] == ["task-1"]
+        assert completed[0].data["task_names"] == ("task-1",)
+
+    def test_agent_handle_records_monotonic_start(self, tmp_path: Path) -> None:
+        """Spawned handles carry a monotonic start used for durations."""
+        repo_path = tmp_path / "my-repo"
+        git = MockGitBackend(local_repos={str(repo_path): repo_path})
+        orch = Orchestrator(
+            backends=_mock_backends(git=git),
+            poll_interval=0,
+            token_store=_mock_token_store(tmp_path),
+        )
+        before = time.monotonic()
+        handle = orch._spawn_agent(
+            _PendingGroup(tasks=[TaskInfo(name="task-1")]),
+            _decision([[TaskInfo(name="task-1")]]),
+            str(repo_path),
+        )
+
+        assert handle is not None
+        assert handle.started_monotonic is not None
+        assert before <= handle.started_monotonic <= time.monotonic()
 
     def test_reporter_receives_failed_event(self, tmp_path: Path) -> None:
         """Reporter.on_agent_failed called on failure."""
@@ -726,6 +828,62 @@ class TestOrchestratorTaskSource:
         # Two agents spawned: one for task-1, one for newly-unblocked task-2
         assert result.agents_spawned == 2
 
+    def test_ready_tasks_queried_off_event_loop(self, tmp_path: Path) -> None:
+        """get_ready_tasks runs in a worker thread, once per completed batch."""
+        repo_path = tmp_path / "my-repo"
+        git = MockGitBackend(local_repos={str(repo_path): repo_path})
+        backends = _mock_backends(git=git)
+        calling_threads: list[threading.Thread] = []
+
+        class RecordingSource(MockTaskSource):
+            def get_ready_tasks(self) -> list[Task]:
+                calling_threads.append(threading.current_thread())
+                return super().get_ready_tasks()
+
+        decision = _decision([[TaskInfo(name="task-1")], [TaskInfo(name="task-2")]])
+
+        orch = Orchestrator(
+            backends=backends,
+            task_source=RecordingSource(),
+            poll_interval=0,
+            token_store=_mock_token_store(tmp_path),
+        )
+        asyncio.run(orch.run(decision, repo=str(repo_path)))
+
+        assert 1 <= len(calling_threads) <= 2
+        assert all(t is not threading.main_thread() for t in calling_threads)
+
+    def test_status_updates_written_off_event_loop(self, tmp_path: Path) -> None:
+        """Status writes happen in the worker thread, before the ready query."""
+        repo_path = tmp_path / "my-repo"
+        git = MockGitBackend(local_repos={str(repo_path): repo_path})
+        backends = _mock_backends(git=git)
+        calls: list[tuple[str, threading.Thread]] = []
+
+        class RecordingSource(MockTaskSource):
+            def update_statuses(self, updates) -> None:
+                calls.append(("update", threading.current_thread()))
+                super().update_statuses(updates)
+
+            def get_ready_tasks(self) -> list[Task]:
+                calls.append(("ready", threading.current_thread()))
+                return super().get_ready_tasks()
+
+        source = RecordingSource()
+        decision = _decision([[TaskInfo(name="task-1")]])
+
+        orch = Orchestrator(
+            backends=backends,
+            task_source=source,
+            poll_interval=0,
+            token_store=_mock_token_store(tmp_path),
+        )
+        asyncio.run(orch.run(decision, repo=str(repo_path)))
+
+        assert [name for name, _ in calls] == ["update", "ready"]
+        assert all(t is not threading.main_thread() for _, t in calls)
+        assert source.status_updates == [("task-1", TaskStatus.completed)]
+
     def test_already_known_tasks_not_re_spawned(self, tmp_path: Path) -> None:
         """Tasks already in the decision are not re-spawned."""
         repo_path = tmp_path / "my-repo"
@@ -848,6 +1006,39 @@ class TestOrchestratorModels:
         assert result.total_time_seconds == 0.0
         assert result.errors == []
 
+    def test_agent_handle_caches_task_names(self) -> None:
+        handle = AgentHandle(
+            id="a", task_group=[TaskInfo(name="t1"), TaskInfo(name="t2")]
+        )
+        assert handle.task_names == ["t1", "t2"]
+
+    def test_pending_group_precomputes_names(self) -> None:
+        pg = _PendingGroup(tasks=[TaskInfo(name="t1"), TaskInfo(name="t2")])
+        assert pg.task_names == ["t1", "t2"]
+        assert pg.description == "t1; t2"
+
+    def test_pending_queue_tracks_task_count(self) -> None:
+        queue = _PendingQueue(
+            [_PendingGroup(tasks=[TaskInfo(name="t1"), TaskInfo(name="t2")])]
+        )
+        assert queue.task_count == 2
+        queue.append(_PendingGroup(tasks=[TaskInfo(name="t3")]))
+        assert queue.task_count == 3
+        queue.popleft()
+        assert queue.task_count == 1
+        queue.clear()
+        assert queue.task_count == 0
+        assert len(queue) == 0
+
+    def test_pending_queue_exposes_only_counted_mutators(self) -> None:
+        queue = _PendingQueue()
+        for name in ("extend", "appendleft", "pop", "remove", "__delitem__"):
+            assert not hasattr(queue, name)
+        assert not queue
+        queue.append(_PendingGroup(tasks=[TaskInfo(name="t1")]))
+        assert queue
+        assert [pg.task_names for pg in queue] == [["t1"]]
+
     def test_failure_policy_values(self) -> None:
         assert FailurePolicy.RETRY == "retry"
         assert FailurePolicy.SKIP == "skip"
@@ -1,5 +1,11 @@
 """Tests for the Planner."""
 
+import dataclasses
+from pathlib import Path
+
+import pytest
+
+from superintendent.orchestrator.models import _graph_errors
 from superintendent.orchestrator.planner import Planner, PlannerInput
 
 
@@ -13,6 +19,11 @@ class TestPlannerInput:
         assert inp.sandbox_name is None
         assert inp.force is False
 
+    def test_is_immutable(self):
+        inp = PlannerInput(repo="/test/repo", task="implement feature")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            inp.task = "other"  # type: ignore[misc]
+
 
 class TestPlanner:
     def test_sandbox_mode_creates_eight_steps(self):
@@ -331,3 +342,22 @@ class TestExtractRepoName:
 
     def test_trailing_slash(self):
         assert Planner._extract_repo_name("https://github.com/user/repo/") == "repo"
+
+    def test_local_path_matches_pathlib(self):
+        for repo in ["my-project", "/a/b/", "a//b", "/a/b/./", ".", "/", "a/b/.."]:
+            path = Path(repo)
+            expected = path.name or path.parent.name
+            assert Planner._extract_repo_name(repo) == expected, repo
+
+
+class TestPlanValidationCache:
+    def test_repeated_plans_reuse_validation(self):
+        _graph_errors.cache_clear()
+        planner = Planner()
+        for i in range(3):
+            planner.create_plan(
+                PlannerInput(repo="/test/repo", task=f"task {i}", sandbox_name=f"s{i}")
+            )
+        info = _graph_errors.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
@@ -3,7 +3,11 @@
 import json
 from pathlib import Path
 
-from superintendent.state.registry import WorktreeEntry, WorktreeRegistry
+from superintendent.state.registry import (
+    WorktreeEntry,
+    WorktreeRegistry,
+    existing_worktree_paths,
+)
 
 
 class TestWorktreeEntry:
@@ -63,6 +67,20 @@ class TestWorktreeEntry:
         assert entry.sandbox_name is None
         assert entry.created_at == "2026-01-01T00:00:00+00:00"
 
+    def test_from_dict_only_stamps_missing_created_at(self, monkeypatch):
+        from superintendent.state import registry
+
+        stamps: list[str] = []
+        monkeypatch.setattr(
+            registry, "_now_iso", lambda: stamps.append("now") or "stamped"
+        )
+        base = {"name": "wt", "repo": "r", "branch": "b", "worktree_path": "/wt"}
+        kept = WorktreeEntry.from_dict({**base, "created_at": "2026-01-01"})
+        assert kept.created_at == "2026-01-01"
+        assert stamps == []
+        assert WorktreeEntry.from_dict(base).created_at == "stamped"
+        assert stamps == ["now"]
+
     def test_roundtrip(self):
         entry = WorktreeEntry(
             name="round",
@@ -248,6 +266,111 @@ class TestWorktreeRegistry:
         assert removed == []
         assert len(reg.list_all()) == 1
 
+    def test_cleanup_siblings_share_one_scandir(self, tmp_path: Path, monkeypatch):
+        from superintendent.state import registry
+
+        reg = WorktreeRegistry(tmp_path / "worktree-registry.json")
+        parent = tmp_path / "worktrees"
+        for name in ("a", "b", "c"):
+            (parent / name).mkdir(parents=True)
+        (parent / "d").symlink_to(parent / "missing")
+        for name in ("a", "b", "c", "d", "gone"):
+            reg.add(
+                WorktreeEntry(
+                    name=name,
+                    repo="repo",
+                    branch=name,
+                    worktree_path=str(parent / name),
+                )
+            )
+
+        scanned: list[str] = []
+        real_scandir = registry.os.scandir
+
+        def counting_scandir(path):
+            scanned.append(str(path))
+            return real_scandir(path)
+
+        monkeypatch.setattr(registry.os, "scandir", counting_scandir)
+        assert sorted(reg.cleanup()) == ["d", "gone"]
+        assert scanned == [str(parent)]
+        assert [e.name for e in reg.list_all()] == ["a", "b", "c"]
+
+    def test_cleanup_missing_parent(self, tmp_path: Path):
+        reg = WorktreeRegistry(tmp_path / "worktree-registry.json")
+        for name in ("x", "y"):
+            reg.add(
+                WorktreeEntry(
+                    name=name,
+                    repo="repo",
+                    branch=name,
+                    worktree_path=str(tmp_path / "no-such-dir" / name),
+                )
+            )
+        assert sorted(reg.cleanup()) == ["x", "y"]
+        assert reg.list_all() == []
+
+    def test_remove_many(self, tmp_path: Path):
+        reg = WorktreeRegistry(tmp_path / "worktree-registry.json")
+        for name in ("a", "b", "c"):
+            reg.add(
+                WorktreeEntry(
+                    name=name, repo="repo", branch=name, worktree_path=f"/tmp/{name}"
+                )
+            )
+        removed = reg.remove_many(["a", "c", "missing"])
+        assert removed == ["a", "c"]
+        assert [e.name for e in reg.list_all()] == ["b"]
+
+    def test_iter_entries_is_lazy(self, tmp_path: Path):
+        reg = WorktreeRegistry(tmp_path / "worktree-registry.json")
+        assert list(reg.iter_entries()) == []
+        for name in ("a", "b"):
+            reg.add(
+                WorktreeEntry(
+                    name=name, repo="repo", branch=name, worktree_path=f"/tmp/{name}"
+                )
+            )
+        it = reg.iter_entries()
+        assert next(it).name == "a"
+        assert [e.name for e in it] == ["b"]
+
+    def test_reads_reuse_parsed_file(self, tmp_path: Path, monkeypatch):
+        reg = WorktreeRegistry(tmp_path / "worktree-registry.json")
+        reg.add(WorktreeEntry(name="a", repo="repo", branch="a", worktree_path="/a"))
+        loads: list[str] = []
+        real_loads = json.loads
+        monkeypatch.setattr(
+            json,
+            "loads",
+            lambda s, *a, **kw: loads.append(s) or real_loads(s, *a, **kw),
+        )
+        assert reg.get("a") is not None
+        assert reg.get_by_branch("a") is not None
+        assert len(reg.list_all()) == 1
+        assert loads == []
+
+    def test_cached_entries_are_not_shared(self, tmp_path: Path):
+        reg = WorktreeRegistry(tmp_path / "worktree-registry.json")
+        reg.add(WorktreeEntry(name="a", repo="repo", branch="a", worktree_path="/a"))
+        entry = reg.get("a")
+        assert entry is not None
+        entry.merged_pr = True
+        fresh = reg.get("a")
+        assert fresh is not None
+        assert fresh.merged_pr is False
+
+    def test_external_write_invalidates_cache(self, tmp_path: Path):
+        registry_path = tmp_path / "worktree-registry.json"
+        reg1 = WorktreeRegistry(registry_path)
+        reg2 = WorktreeRegistry(registry_path)
+        reg1.add(WorktreeEntry(name="a", repo="repo", branch="a", worktree_path="/a"))
+        assert [e.name for e in reg2.list_all()] == ["a"]
+        reg1.add(WorktreeEntry(name="bb", repo="repo", branch="b", worktree_path="/b"))
+        assert [e.name for e in reg2.list_all()] == ["a", "bb"]
+        registry_path.unlink()
+        assert reg2.list_all() == []
+
     def test_persists_to_disk(self, tmp_path: Path):
         registry_path = tmp_path / "worktree-registry.json"
         reg1 = WorktreeRegistry(registry_path)
@@ -357,3 +480,48 @@ class TestWorktreeRegistry:
         entry = reg.get_by_branch("shared-branch")
         assert entry is not None
         assert entry.name == "wt-1"
+
+
+class TestExistingWorktreePaths:
+    """Test the batched existence check shared by every cleanup path."""
+
+    def test_shared_parent(self, tmp_path: Path):
+        live = tmp_path / "repo" / "live"
+        live.mkdir(parents=True)
+        gone = tmp_path / "repo" / "gone"
+        assert existing_worktree_paths([str(live), str(gone)]) == {str(live)}
+
+    def test_single_entry_parent(self, tmp_path: Path):
+        outside = tmp_path / "a" / "elsewhere"
+        outside.mkdir(parents=True)
+        paths = [str(outside), str(tmp_path / "b" / "gone")]
+        assert existing_worktree_paths(paths) == {str(outside)}
+
+    def test_missing_parent(self, tmp_path: Path):
+        absent = tmp_path / "absent"
+        assert existing_worktree_paths([str(absent / "x"), str(absent / "y")]) == set()
+
+    def test_dangling_symlinks_do_not_exist(self, tmp_path: Path):
+        parent = tmp_path / "repo"
+        (parent / "live").mkdir(parents=True)
+        (parent / "dangling").symlink_to(parent / "missing")
+        (parent / "linked").symlink_to(parent / "live")
+        paths = [str(parent / name) for name in ("live", "dangling", "linked")]
+        assert existing_worktree_paths(paths) == {
+            str(parent / "live"),
+            str(parent / "linked"),
+        }
+
+    def test_unlistable_parent_falls_back_to_stat(self, tmp_path: Path, monkeypatch):
+        from superintendent.state import registry
+
+        parent = tmp_path / "repo"
+        (parent / "a").mkdir(parents=True)
+        (parent / "b").mkdir()
+
+        def deny(_path):
+            raise PermissionError("cannot list")
+
+        monkeypatch.setattr(registry.os, "scandir", deny)
+        paths = [str(parent / "a"), str(parent / "b"), str(parent / "c")]
+        assert existing_worktree_paths(paths) == {str(parent / "a"), str(parent / "b")}
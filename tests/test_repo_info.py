@@ -59,6 +59,20 @@ class TestRepoInfoFromPath:
         info = RepoInfo.from_path(tmp_path)
         assert info.has_devcontainer is True
 
+    def test_detects_symlinked_devcontainer_dir(self, tmp_path: Path):
+        real = tmp_path / "shared-devcontainer"
+        real.mkdir()
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        (repo / ".devcontainer").symlink_to(real, target_is_directory=True)
+        info = RepoInfo.from_path(repo)
+        assert info.has_devcontainer is True
+
+    def test_devcontainer_file_is_not_a_devcontainer(self, tmp_path: Path):
+        (tmp_path / ".devcontainer").write_text("not a directory")
+        info = RepoInfo.from_path(tmp_path)
+        assert info.has_devcontainer is False
+
     def test_detects_env_file(self, tmp_path: Path):
         (tmp_path / ".env").write_text("SECRET=foo")
         info = RepoInfo.from_path(tmp_path)
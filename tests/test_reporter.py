@@ -1,6 +1,7 @@
 """Tests for the Reporter protocol and implementations."""
 
 from superintendent.orchestrator.reporter import (
+    AgentEvent,
     DryRunReporter,
     MockReporter,
     RealReporter,
@@ -127,9 +128,26 @@ class TestMockReporter:
         event = reporter.events[0]
         assert event.event_type == "started"
         assert event.agent_id == "agent-1"
-        assert event.data["task_names"] == ["task-a"]
+        assert event.data["task_names"] == ("task-a",)
         assert event.data["sandbox_name"] == "sb-1"
 
+    def test_event_snapshots_task_names(self):
+        reporter = MockReporter()
+        names = ["task-a"]
+        reporter.on_agent_started("agent-1", names)
+        names.append("task-b")
+        assert reporter.events[0].data["task_names"] == ("task-a",)
+
+    def test_events_carry_monotonic_timestamps(self):
+        reporter = MockReporter()
+        reporter.on_agent_started("agent-1", ["task-a"])
+        reporter.on_agent_completed("agent-1", ["task-a"], duration_seconds=1.0)
+        first, second = reporter.events
+        assert 0 < first.timestamp_ns <= second.timestamp_ns
+
+    def test_event_timestamp_defaults_to_zero(self):
+        assert AgentEvent(event_type="started", agent_id="a").timestamp_ns == 0
+
     def test_on_agent_completed_records_event(self):
         reporter = MockReporter()
         reporter.on_agent_completed("agent-1", ["task-a"], duration_seconds=60.0)
@@ -5,6 +5,7 @@ from pathlib import Path
 from superintendent.backends.git import MockGitBackend
 from superintendent.cli.main import (
     analyze_entry,
+    cleanup_all,
     smart_cleanup,
 )
 from superintendent.state.registry import WorktreeEntry, WorktreeRegistry
@@ -95,6 +96,15 @@ class TestAnalyzeEntry:
         assert "has unpushed commits" in candidate.warnings
         assert candidate.force_required is True
 
+    def test_existing_paths_overrides_filesystem(self, tmp_path: Path) -> None:
+        wt = tmp_path / "wt"
+        wt.mkdir()
+        entry = _make_entry(worktree_path=str(wt), branch="active")
+        git = MockGitBackend(remote_branches={"active"})
+        candidate = analyze_entry(entry, git, existing_paths=set())
+        assert candidate is not None
+        assert candidate.reasons == ["path does not exist"]
+
     def test_missing_path_no_safety_checks(self) -> None:
         """Missing path entries skip safety checks (nothing to inspect)."""
         entry = _make_entry(worktree_path="/nonexistent")
@@ -170,3 +180,54 @@ class TestSmartCleanup:
         git = MockGitBackend(remote_branches={"active"})
         candidates = smart_cleanup(registry, git)
         assert len(candidates) == 0
+
+
+class TestCleanupExistenceChecks:
+    """Cleanup must never treat a live worktree as missing."""
+
+    def _deny_listing(self, monkeypatch) -> None:
+        from superintendent.state import registry
+
+        def deny(_path):
+            raise PermissionError("cannot list")
+
+        monkeypatch.setattr(registry.os, "scandir", deny)
+
+    def _registry_with_live_siblings(self, tmp_path: Path) -> WorktreeRegistry:
+        registry = WorktreeRegistry(tmp_path / "registry.json")
+        for name in ("one", "two"):
+            wt = tmp_path / "worktrees" / name
+            wt.mkdir(parents=True)
+            registry.add(_make_entry(name=name, worktree_path=str(wt), branch=name))
+        return registry
+
+    def test_cleanup_all_keeps_worktrees_under_unlistable_parent(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        registry = self._registry_with_live_siblings(tmp_path)
+        self._deny_listing(monkeypatch)
+        assert cleanup_all(registry) == []
+        assert len(registry.list_all()) == 2
+
+    def test_smart_cleanup_runs_safety_checks_under_unlistable_parent(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        registry = self._registry_with_live_siblings(tmp_path)
+        self._deny_listing(monkeypatch)
+        git = MockGitBackend(
+            merged_branches={"one", "two"},
+            dirty_worktrees={str(tmp_path / "worktrees" / "one")},
+            remote_branches={"one", "two"},
+        )
+        candidates = smart_cleanup(registry, git)
+        by_name = {c.entry.name: c for c in candidates}
+        assert "path does not exist" not in by_name["one"].reasons
+        assert by_name["one"].force_required is True
+        assert registry.get("one") is not None
+
+    def test_dangling_symlink_is_stale(self, tmp_path: Path) -> None:
+        registry = self._registry_with_live_siblings(tmp_path)
+        link = tmp_path / "worktrees" / "dangling"
+        link.symlink_to(tmp_path / "missing")
+        registry.add(_make_entry(name="dangling", worktree_path=str(link)))
+        assert cleanup_all(registry) == ["dangling"]
@@ -1,5 +1,6 @@
 """Tests for SpecKitSource adapter."""
 
+import os
 from pathlib import Path
 from textwrap import dedent
 
@@ -65,6 +66,15 @@ class TestSpecKitSourceDetection:
     def test_rejects_missing_file(self, tmp_path: Path) -> None:
         assert SpecKitSource.can_handle(tmp_path) is False
 
+    def test_rejects_empty_file(self, tmp_path: Path) -> None:
+        (tmp_path / "tasks.md").write_text("")
+        assert SpecKitSource.can_handle(tmp_path) is False
+
+    def test_detects_task_after_long_preamble(self, tmp_path: Path) -> None:
+        md = tmp_path / "tasks.md"
+        md.write_text("Notes\n" * 5000 + BASIC_SPECKIT)
+        assert SpecKitSource.can_handle(tmp_path) is True
+
     def test_create_returns_instance(self, tmp_path: Path) -> None:
         md = tmp_path / "tasks.md"
         md.write_text(BASIC_SPECKIT)
@@ -112,6 +122,13 @@ class TestSpecKitSourceParsing:
         tasks = source.get_tasks()
         assert tasks[0].source_ref == str(md)
 
+    def test_task_line_does_not_span_lines(self, tmp_path: Path) -> None:
+        md = tmp_path / "tasks.md"
+        md.write_text("- [ ] [T001]\nnot a task\n- [ ] [T002] Real task\n")
+        source = SpecKitSource(md)
+        tasks = source.get_tasks()
+        assert [t.task_id for t in tasks] == ["T002"]
+
 
 class TestSpecKitParallelMarkers:
     def test_parallel_tasks_have_label(self, tmp_path: Path) -> None:
@@ -238,6 +255,74 @@ class TestSpecKitStatusUpdate:
         assert md.read_text() == original
 
 
+class TestSpecKitCache:
+    def test_repeat_reads_reuse_parse(self, tmp_path: Path, monkeypatch) -> None:
+        md = tmp_path / "tasks.md"
+        md.write_text(BASIC_SPECKIT)
+        source = SpecKitSource(md)
+        calls = []
+        parse = SpecKitSource._parse_tasks
+        monkeypatch.setattr(
+            SpecKitSource, "_parse_tasks", lambda *args: calls.append(1) or parse(*args)
+        )
+        first = source.get_tasks()
+        source.get_ready_tasks()
+        assert len(calls) == 1
+        assert [t.task_id for t in source.get_tasks()] == [t.task_id for t in first]
+
+    def test_update_status_invalidates(self, tmp_path: Path) -> None:
+        md = tmp_path / "tasks.md"
+        md.write_text(BASIC_SPECKIT)
+        source = SpecKitSource(md)
+        source.get_tasks()
+        source.update_status("T001", TaskStatus.completed)
+        statuses = {t.task_id: t.status for t in source.get_tasks()}
+        assert statuses["T001"] == TaskStatus.completed
+
+    def test_update_status_reuses_parse(self, tmp_path: Path, monkeypatch):
+        md = tmp_path / "tasks.md"
+        md.write_text(BASIC_SPECKIT)
+        source = SpecKitSource(md)
+        source.get_tasks()
+        calls = []
+        parse = SpecKitSource._parse_tasks
+        monkeypatch.setattr(
+            SpecKitSource,
+            "_parse_tasks",
+            lambda *args: calls.append(1) or parse(*args),
+        )
+        source.update_status("T001", TaskStatus.completed)
+        assert calls == []
+        assert "- [x] [T001]" in md.read_text()
+
+    def test_mutating_returned_tasks_does_not_touch_cache(self, tmp_path: Path):
+        md = tmp_path / "tasks.md"
+        md.write_text(BASIC_SPECKIT)
+        source = SpecKitSource(md)
+        for task in source.get_tasks() + source.get_ready_tasks():
+            task.status = TaskStatus.failed
+            task.dependencies.append("bogus")
+            task.labels["x"] = "y"
+        fresh = source.get_tasks()
+        assert TaskStatus.failed not in {t.status for t in fresh}
+        assert all("bogus" not in t.dependencies for t in fresh)
+        assert all("x" not in t.labels for t in source.get_ready_tasks())
+
+    def test_same_size_edit_in_same_mtime_tick(self, tmp_path: Path):
+        md = tmp_path / "tasks.md"
+        md.write_text(BASIC_SPECKIT)
+        source = SpecKitSource(md)
+        assert source.get_tasks()[0].status == TaskStatus.pending
+        before = md.stat()
+        edited = BASIC_SPECKIT.replace("- [ ] [T001]", "- [x] [T001]", 1)
+        assert len(edited) == len(BASIC_SPECKIT)
+        md.write_text(edited)
+        os.utime(md, ns=(before.st_atime_ns, before.st_mtime_ns))
+        assert md.stat().st_size == before.st_size
+        assert source.get_tasks()[0].status == TaskStatus.completed
+        assert "T001" not in [t.task_id for t in source.get_ready_tasks()]
+
+
 class TestSpecKitClaim:
     def test_claim_returns_true(self, tmp_path: Path) -> None:
         md = tmp_path / "tasks.md"
@@ -7,7 +7,11 @@ from superintendent.backends.git import MockGitBackend
 from superintendent.backends.terminal import MockTerminalBackend
 from superintendent.orchestrator.executor import StepHandler
 from superintendent.orchestrator.models import WorkflowStep
-from superintendent.orchestrator.step_handler import ExecutionContext, RealStepHandler
+from superintendent.orchestrator.step_handler import (
+    ExecutionContext,
+    RealStepHandler,
+    default_worktrees_dir,
+)
 from superintendent.state.token_store import TokenStore
 
 
@@ -1512,3 +1516,8 @@ class TestFullPlanExecution:
         assert result.error is None, f"Unexpected error: {result.error}"
         assert len(result.completed_steps) == 4
         assert result.failed_step is None
+
+
+def test_default_worktrees_dir_follows_home(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    assert default_worktrees_dir() == tmp_path / ".claude-worktrees"
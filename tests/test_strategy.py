@@ -289,6 +289,33 @@ class TestExecutionStrategy:
         decision = strategy.decide(tasks, self._default_repo_info())
         assert len(decision.task_groups) == 2
 
+    def test_grouping_keeps_task_order_across_merges(self):
+        strategy = ExecutionStrategy()
+        tasks = [
+            TaskInfo(name="a"),
+            TaskInfo(name="x"),
+            TaskInfo(name="b", depends_on=["c"]),
+            TaskInfo(name="c"),
+            TaskInfo(name="d", depends_on=["a", "b", "missing"]),
+        ]
+        groups = strategy._group_tasks(tasks)
+        assert [[t.name for t in g] for g in groups] == [["a", "b", "c", "d"], ["x"]]
+
+    def test_long_dependency_chain_forms_one_group(self):
+        strategy = ExecutionStrategy()
+        tasks = [TaskInfo(name="t0")] + [
+            TaskInfo(name=f"t{i}", depends_on=[f"t{i - 1}"]) for i in range(1, 500)
+        ]
+        groups = strategy._group_tasks(tasks)
+        assert len(groups) == 1
+        assert groups[0] == tasks
+
+    def test_no_dependency_grouping_matches_union_find(self):
+        strategy = ExecutionStrategy()
+        tasks = [TaskInfo(name="a"), TaskInfo(name="b"), TaskInfo(name="a")]
+        groups = strategy._group_tasks(tasks)
+        assert groups == [[tasks[0], tasks[2]], [tasks[1]]]
+
     # --- CLI override tests ---
 
     def test_mode_override(self):
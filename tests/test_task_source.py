@@ -15,6 +15,21 @@ class TestTaskStatus:
 
 
 class TestTask:
+    def test_copy_is_independent(self):
+        task = Task(
+            task_id="t1",
+            title="Fix bug",
+            description="",
+            dependencies=["t0"],
+            labels={"phase": "1"},
+        )
+        copy = task.copy()
+        assert copy == task
+        copy.dependencies.append("t2")
+        copy.labels["phase"] = "2"
+        assert task.dependencies == ["t0"]
+        assert task.labels == {"phase": "1"}
+
     def test_minimal_creation(self):
         task = Task(task_id="t1", title="Fix bug", description="Fix the login bug")
         assert task.task_id == "t1"
@@ -136,6 +151,29 @@ class TestTaskSourceABC:
         source = ValidSource()
         assert isinstance(source, TaskSource)
 
+    def test_update_statuses_defaults_to_update_status(self):
+        from superintendent.orchestrator.sources.protocol import TaskSource
+
+        class RecordingSource(TaskSource):
+            def __init__(self) -> None:
+                self.updates: list[tuple[str, TaskStatus]] = []
+
+            def get_tasks(self) -> list[Task]:
+                return []
+
+            def get_ready_tasks(self) -> list[Task]:
+                return []
+
+            def update_status(self, task_id: str, status: TaskStatus) -> None:
+                self.updates.append((task_id, status))
+
+            def claim_task(self, _task_id: str) -> bool:
+                return True
+
+        source = RecordingSource()
+        source.update_statuses([("a", TaskStatus.completed), ("b", TaskStatus.failed)])
+        assert source.updates == [("a", TaskStatus.completed), ("b", TaskStatus.failed)]
+
     def test_incomplete_subclass_cannot_instantiate(self):
         import pytest
 
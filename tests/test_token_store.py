@@ -1,8 +1,12 @@
 """Tests for the token store module."""
 
+import dataclasses
 import json
+import stat
 from pathlib import Path
 
+import pytest
+
 from superintendent.state.token_store import (
     DEFAULT_KEY,
     ResolveResult,
@@ -102,6 +106,17 @@ class TestTokenStore:
         assert entry is not None
         assert entry.token == "ghp_new"
 
+    def test_mutations_keep_other_entries_verbatim(self, tmp_path: Path) -> None:
+        path = tmp_path / "tokens.json"
+        other = {"token": "ghp_other", "created_at": "2026-01-01", "permissions": []}
+        path.write_text(json.dumps({"owner/other": other, "owner/gone": other}))
+        store = TokenStore(path)
+        store.add("owner/new", "ghp_new")
+        assert store.remove("owner/gone")
+        data = json.loads(path.read_text())
+        assert data["owner/other"] == other
+        assert set(data) == {"owner/other", "owner/new"}
+
     def test_get_nonexistent(self, tmp_path: Path) -> None:
         store = TokenStore(tmp_path / "tokens.json")
         assert store.get("owner/repo") is None
@@ -141,6 +156,11 @@ class TestTokenStore:
         store.add("owner/repo", "ghp_deep")
         assert path.exists()
 
+    def test_new_store_is_owner_only(self, tmp_path: Path) -> None:
+        path = tmp_path / "tokens.json"
+        TokenStore(path).add("owner/repo", "ghp_test")
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
     def test_file_is_valid_json(self, tmp_path: Path) -> None:
         path = tmp_path / "tokens.json"
         store = TokenStore(path)
@@ -184,6 +204,11 @@ class TestResolveResult:
         assert r.token is None
         assert r.source == "none"
 
+    def test_frozen(self) -> None:
+        r = ResolveResult(token=None, source="none")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            r.token = "ghp_abc"  # type: ignore[misc]
+
 
 class TestTokenStoreDefault:
     """Test default token via standard add/get/remove with DEFAULT_KEY."""
@@ -317,6 +342,25 @@ class TestTokenStoreResolve:
         assert result.token is None
         assert result.source == "none"
 
+    def test_resolve_only_builds_consulted_entries(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        store = TokenStore(tmp_path / "tokens.json")
+        store.add(DEFAULT_KEY, "ghp_default", github_user="brendanwhit")
+        for i in range(5):
+            store.add(f"org/repo-{i}", f"ghp_{i}")
+        built: list[str] = []
+        real_from_dict = TokenEntry.from_dict
+
+        def recording_from_dict(data: dict) -> TokenEntry:
+            built.append(data["token"])
+            return real_from_dict(data)
+
+        monkeypatch.setattr(TokenEntry, "from_dict", recording_from_dict)
+        assert store.resolve("org/repo-3").token == "ghp_3"
+        assert store.resolve("brendanwhit/x").token == "ghp_default"
+        assert built == ["ghp_default"]
+
 
 class TestTokenStoreBackwardCompatibility:
     """Test that legacy files without _default key work correctly."""
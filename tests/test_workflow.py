@@ -1,6 +1,8 @@
 """Tests for WorkflowState enum and transitions."""
 
 from superintendent.state.workflow import (
+    _TRANSITIONS,
+    STATE_BY_NAME,
     WORKFLOW_ORDER,
     WorkflowState,
     is_terminal,
@@ -32,6 +34,9 @@ class TestWorkflowState:
     def test_state_count(self):
         assert len(WorkflowState) == 13
 
+    def test_state_by_name_covers_every_state(self):
+        assert {s.name: s for s in WorkflowState} == STATE_BY_NAME
+
 
 class TestTransitions:
     def test_valid_forward_transitions(self):
@@ -103,6 +108,12 @@ class TestTransitions:
             if state != WorkflowState.INIT:
                 assert not valid_transition(state, WorkflowState.INIT)
 
+    def test_matches_transition_table_for_every_pair(self):
+        for current in WorkflowState:
+            for target in WorkflowState:
+                expected = target in _TRANSITIONS[current]
+                assert valid_transition(current, target) is expected
+
 
 class TestNextState:
     def test_next_from_init(self):